@@ -0,0 +1,152 @@
+"""
+Compare the database connection profiles on insert- and read-heavy
+workloads.
+
+Each profile gets a fresh database with the current schema. SQLite's own
+defaults (rollback journal, synchronous=FULL) are measured alongside as a
+baseline. Workloads:
+
+  single inserts   one committed transaction per row, like saving a form
+  batch insert     all rows in one transaction, like an import
+  reads            primary key lookups and keyset pages over the table
+  mixed            a reader paging the table while a writer commits rows
+
+fsync cost depends on the filesystem, so the databases are created next to
+this script unless --dir says otherwise (a tmpfs hides the difference).
+
+Usage: python benchmarks/db_profiles.py [--rows N] [--commits N] [--dir PATH]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracker.core import database
+
+BASELINE = {"journal_mode": "DELETE", "synchronous": "FULL"}
+PAGE_SIZE = 100
+MIXED_SECONDS = 2.0
+
+def connect(path, pragmas):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    for pragma, value in pragmas.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return conn
+
+def contact(i):
+    return (f"Contact {i}", f"Company {i % 500}", "🔵 Not Connected")
+
+def single_inserts(conn, commits):
+    for i in range(commits):
+        with conn:
+            conn.execute("INSERT INTO outreaches (name, company, status) VALUES (?, ?, ?)", contact(i))
+    return commits
+
+def batch_insert(conn, rows):
+    with conn:
+        conn.executemany(
+            "INSERT INTO outreaches (name, company, status) VALUES (?, ?, ?)",
+            (contact(i) for i in range(rows))
+        )
+    return rows
+
+def read_page(conn, after):
+    return conn.execute(
+        "SELECT id, name, company, status FROM outreaches WHERE id > ? ORDER BY id LIMIT ?",
+        (after, PAGE_SIZE)
+    ).fetchall()
+
+def reads(conn, rows):
+    rng = random.Random(1)
+    max_id = conn.execute("SELECT MAX(id) FROM outreaches").fetchone()[0]
+    for _ in range(rows // 10):
+        conn.execute("SELECT * FROM outreaches WHERE id = ?", (rng.randint(1, max_id),)).fetchone()
+    after = 0
+    while True:
+        page = read_page(conn, after)
+        if not page:
+            break
+        after = page[-1][0]
+    return rows // 10 + rows // PAGE_SIZE
+
+def mixed(path, pragmas):
+    """Return (pages read, rows committed) while both run for MIXED_SECONDS"""
+    stop = threading.Event()
+    counts = {"pages": 0, "commits": 0}
+
+    def reader():
+        conn = connect(path, pragmas)
+        after = 0
+        while not stop.is_set():
+            page = read_page(conn, after)
+            after = page[-1][0] if page else 0
+            counts["pages"] += 1
+        conn.close()
+
+    def writer():
+        conn = connect(path, pragmas)
+        i = 0
+        while not stop.is_set():
+            with conn:
+                conn.execute("INSERT INTO outreaches (name, company, status) VALUES (?, ?, ?)", contact(i))
+            counts["commits"] += 1
+            i += 1
+        conn.close()
+
+    threads = [threading.Thread(target=reader), threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    time.sleep(MIXED_SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return counts["pages"], counts["commits"]
+
+def timed(func, *args):
+    start = time.perf_counter()
+    count = func(*args)
+    return count, time.perf_counter() - start
+
+def run_profile(directory, name, pragmas, rows, commits):
+    path = os.path.join(directory, f"{name}.db")
+    database.configure_database(path)
+    database.create_tables()
+    database.close_connections()
+
+    conn = connect(path, pragmas)
+    results = {}
+    count, seconds = timed(single_inserts, conn, commits)
+    results["single inserts"] = f"{count / seconds:10.0f} commits/s"
+    count, seconds = timed(batch_insert, conn, rows)
+    results["batch insert"] = f"{count / seconds:10.0f} rows/s"
+    count, seconds = timed(reads, conn, rows)
+    results["reads"] = f"{count / seconds:10.0f} queries/s"
+    conn.close()
+
+    pages, written = mixed(path, pragmas)
+    results["mixed"] = f"{pages / MIXED_SECONDS:10.0f} pages/s, {written / MIXED_SECONDS:.0f} commits/s"
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="rows for the batch insert and reads")
+    parser.add_argument("--commits", type=int, default=500, help="single-row transactions")
+    parser.add_argument("--dir", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="directory for the throwaway databases")
+    args = parser.parse_args()
+
+    profiles = {"sqlite defaults": BASELINE, **database.PROFILES}
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for name, pragmas in profiles.items():
+            print(f"\n=== {name} ===")
+            for workload, result in run_profile(tmp, name, pragmas, args.rows, args.commits).items():
+                print(f"  {workload:<16}{result}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Show query plans and timings for the hot lookups before and after the
+schema indexes are created.
+
+Builds a throwaway database with synthetic data at schema version 2 (no
+indexes), runs each query, then migrates to the latest version and runs
+them again.
+
+Usage: python benchmarks/query_plans.py [--rows N]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracker.core import database
+
+STATUSES = ["🔵 Not Connected", "✅ Connected", "💬 Messaged", "👻 Ghosted", "🏆 Offer"]
+REMINDER_STATUSES = ["pending", "completed", "snoozed"]
+
+QUERIES = [
+    ("Document.find_related", '''
+        SELECT d.id, d.name FROM documents d
+        JOIN document_usage du ON d.id = du.document_id
+        WHERE du.related_type = ? AND du.related_id = ?
+    ''', ("contact", 42)),
+    ("Document.find_linked_ids", '''
+        SELECT related_id FROM document_usage
+        WHERE document_id = ? AND related_type = ?
+    ''', (7, "contact")),
+    ("Reminder.find_by_related", '''
+        SELECT * FROM reminders WHERE related_type = ? AND related_id = ?
+    ''', ("contact", 42)),
+    ("Reminder pending by date", '''
+        SELECT * FROM reminders WHERE status = ? AND due_date <= ?
+    ''', ("pending", "2024-01-01")),
+    ("Contacts status filter", '''
+        SELECT * FROM outreaches WHERE status = ?
+    ''', ("🏆 Offer",)),
+    ("Applications status filter", '''
+        SELECT * FROM applications WHERE status = ?
+    ''', ("✅ Applied",)),
+]
+
+def populate(conn, rows):
+    rng = random.Random(1)
+    conn.executemany(
+        "INSERT INTO outreaches (name, company, status) VALUES (?, ?, ?)",
+        ((f"Contact {i}", f"Company {i % 500}", rng.choice(STATUSES)) for i in range(rows))
+    )
+    conn.executemany(
+        "INSERT INTO applications (title, name, status) VALUES (?, ?, ?)",
+        ((f"Role {i}", f"Company {i % 500}", rng.choice(["✅ Applied", "❌ Rejected"])) for i in range(rows))
+    )
+    conn.executemany(
+        "INSERT INTO reminders (related_type, related_id, title, due_date, status) VALUES (?, ?, ?, ?, ?)",
+        (("contact", rng.randrange(rows), f"Reminder {i}",
+          f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", rng.choice(REMINDER_STATUSES))
+         for i in range(rows))
+    )
+    conn.executemany(
+        "INSERT INTO documents (name, type, version) VALUES (?, ?, ?)",
+        ((f"Doc {i}", "Resume", "1.0") for i in range(rows // 10))
+    )
+    conn.executemany(
+        "INSERT INTO document_usage (document_id, related_type, related_id) VALUES (?, ?, ?)",
+        ((rng.randrange(1, rows // 10), "contact", rng.randrange(rows)) for _ in range(rows))
+    )
+    conn.commit()
+
+def report(conn, label, repeat=20):
+    print(f"\n=== {label} (schema version {database.schema_version()}) ===")
+    for name, sql, params in QUERIES:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(sql, params).fetchall()
+        elapsed = (time.perf_counter() - start) / repeat * 1000
+        print(f"\n{name}: {elapsed:.3f} ms")
+        for row in plan:
+            print(f"    {row[-1]}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="rows per table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure_database(os.path.join(tmp, "bench.db"))
+        database.migrate_schema(target_version=2)
+        conn = database.get_connection()
+        populate(conn, args.rows)
+
+        report(conn, "Before indexes")
+        database.migrate_schema()
+        conn.execute("ANALYZE")
+        report(conn, "After indexes")
+
+        database.close_connections()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Check cold-start time against a budget on a synthetic database.
+
+Builds a throwaway database with N contacts and applications, then starts
+`main.py --profile-startup` in a fresh interpreter several times and takes
+the median time until the first contacts are on screen. Without a display
+it times the same path minus the window in a fresh interpreter: imports,
+schema check, blob migration and the first page of contacts.
+
+Exits with status 1 when the median is over budget, so it can gate CI.
+
+Usage: python benchmarks/startup.py [--rows N] [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STATUSES = ["🔵 Not Connected", "✅ Connected", "💬 Messaged", "👻 Ghosted", "🏆 Offer"]
+WINDOW_BUDGET_MS = 1500.0
+HEADLESS_BUDGET_MS = 500.0
+TOTAL_PATTERN = re.compile(r"^\s*total\s+([\d.]+)", re.MULTILINE)
+
+def populate(db_path, rows):
+    from tracker.core import database
+
+    database.configure_database(db_path)
+    database.create_tables()
+    rng = random.Random(1)
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO outreaches (name, company, title, email, status, last_response, notes) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((f"Contact {i}", f"Company {i % 500}", f"Engineer {i % 40}", f"contact{i}@example.com",
+              rng.choice(STATUSES), f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+              "Met at a meetup; follow up about the platform team. " * 3)
+             for i in range(rows))
+        )
+        conn.executemany(
+            "INSERT INTO applications (title, name, status, notes) VALUES (?, ?, ?, ?)",
+            ((f"Role {i}", f"Company {i % 500}", "✅ Applied", "Referred by a former colleague.")
+             for i in range(rows))
+        )
+    database.close_connections()
+
+def headless_startup(db_path):
+    """Run the startup path without a window and print its timings (child process)"""
+    from tracker.ui.main_window import StartupTimer
+    from tracker.core.database import configure_database, create_tables
+    from tracker.core.executor import shutdown, submit
+    from tracker.core.storage import migrate_document_blobs
+    from tracker.core.models import Contact
+    from tracker.utils.ui_components import QueryRowProvider
+
+    timer = StartupTimer()
+    timer.mark("imports")
+    configure_database(db_path)
+    create_tables()
+    timer.mark("schema")
+    submit(migrate_document_blobs)
+    QueryRowProvider(Contact, lambda contact: contact).prefetch()
+    timer.mark("first data load")
+    print(timer.report())
+    shutdown()
+
+def has_display():
+    import tkinter as tk
+    try:
+        tk.Tk().destroy()
+        return True
+    except tk.TclError:
+        return False
+
+def run_once(db_path, with_window):
+    if with_window:
+        command = [sys.executable, os.path.join(ROOT, "main.py"), "--database", db_path, "--profile-startup"]
+    else:
+        command = [sys.executable, os.path.abspath(__file__), "--headless-child", db_path]
+    started = time.perf_counter()
+    output = subprocess.run(command, capture_output=True, text=True, check=True, cwd=ROOT).stdout
+    wall = (time.perf_counter() - started) * 1000
+    match = TOTAL_PATTERN.search(output)
+    if not match:
+        raise RuntimeError(f"No startup report in output:\n{output}")
+    return float(match.group(1)), wall, output
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="contacts and applications to create")
+    parser.add_argument("--runs", type=int, default=5, help="startups to take the median of")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail above this median (default 1500 with a window, 500 without)")
+    parser.add_argument("--headless-child", metavar="DB", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.headless_child:
+        headless_startup(args.headless_child)
+        return
+
+    with_window = has_display()
+    budget = args.budget_ms or (WINDOW_BUDGET_MS if with_window else HEADLESS_BUDGET_MS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "startup.db")
+        populate(db_path, args.rows)
+
+        # The first run warms the OS file cache, like any launch after the first
+        run_once(db_path, with_window)
+        results = [run_once(db_path, with_window) for _ in range(args.runs)]
+
+    totals = [total for total, _, _ in results]
+    median = statistics.median(totals)
+    print(results[-1][2].split("\n\n")[0].rstrip())
+    print(f"\n{'window' if with_window else 'headless'} startup, {args.rows} rows, {args.runs} runs")
+    print(f"median to first data: {median:.1f} ms (budget {budget:.0f} ms), "
+          f"process wall time {statistics.median(w for _, w, _ in results):.1f} ms")
+
+    if median > budget:
+        print("FAIL: startup is over budget")
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
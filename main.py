@@ -1,4 +1,32 @@
-from tracker.ui.main_window import run_gui
+import argparse
+
+def main():
+    parser = argparse.ArgumentParser(description="Outreach And Application Tracker")
+    parser.add_argument("--database", metavar="PATH",
+                        help="database file to open instead of outreach_tracker.db")
+    parser.add_argument("--db-profile", metavar="NAME",
+                        help="database connection profile: safe (default), fast or bulk-import")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print how long each startup phase takes")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="profile startup up to the first rows on screen, print the results and exit")
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile_startup:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    # Imported here so the profiler sees the imports too
+    from tracker.ui.main_window import run_gui
+    from tracker.core.database import PROFILES, configure_database
+
+    if args.db_profile is not None and args.db_profile not in PROFILES:
+        parser.error(f"unknown database profile: {args.db_profile}")
+    if args.database or args.db_profile:
+        configure_database(args.database, args.db_profile)
+    run_gui(startup_report=args.startup_report, profiler=profiler)
 
 if __name__ == "__main__":
-    run_gui()
+    main()
@@ -0,0 +1,17 @@
+import pytest
+
+from tracker.core import database
+from tracker.core.models import identity_map
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh database at the latest schema version, closed afterwards"""
+    database.configure_database(str(tmp_path / "tracker.db"))
+    database.create_tables()
+    identity_map.clear()
+    yield database.get_connection()
+    identity_map.clear()
+    database.close_connections()
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: builds large databases or starts subprocesses")
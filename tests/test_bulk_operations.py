@@ -0,0 +1,66 @@
+from tracker.core.models import Contact, Reminder
+
+def names():
+    return {row.id: row.name for row in Contact.find_all()}
+
+def test_save_many_assigns_consecutive_ids(db):
+    Contact(name="existing").save()
+    contacts = [Contact(name=f"c{i}") for i in range(5)]
+
+    ids = Contact.save_many(contacts)
+
+    assert ids == [contact.id for contact in contacts]
+    assert ids == list(range(ids[0], ids[0] + 5))
+    assert names() == {1: "existing", **{contact.id: contact.name for contact in contacts}}
+
+def test_save_many_mixes_inserts_and_updates(db):
+    first = Contact(name="first")
+    first.save()
+    first.name = "renamed"
+    new = Contact(name="new")
+
+    Contact.save_many([first, new])
+
+    assert names() == {first.id: "renamed", new.id: "new"}
+
+def test_save_many_groups_rows_by_loaded_columns(db):
+    reminders = [Reminder(title="a", due_date="2024-01-02"), Reminder(title="b")]
+    del reminders[1].__dict__["due_date"]
+
+    Reminder.save_many(reminders)
+
+    stored = {reminder.id: reminder.due_date for reminder in Reminder.find_all()}
+    assert stored == {reminders[0].id: "2024-01-02", reminders[1].id: None}
+
+def test_upsert_many_updates_inserts_and_creates_by_id(db):
+    existing = Contact(name="existing", company="old")
+    existing.save()
+    existing.company = "new"
+    missing = Contact(id=42, name="recreated")
+    fresh = Contact(name="fresh")
+
+    Contact.upsert_many([existing, missing, fresh])
+
+    rows = {row.id: (row.name, row.company) for row in Contact.find_all()}
+    assert rows[existing.id] == ("existing", "new")
+    assert rows[42] == ("recreated", "")
+    assert rows[fresh.id] == ("fresh", "")
+    assert len(rows) == 3
+
+def test_upsert_many_keeps_created_at(db):
+    contact = Contact(name="a", created_at="2020-01-01 00:00:00")
+    contact.save()
+    contact.created_at = "2099-01-01 00:00:00"
+
+    Contact.upsert_many([contact])
+
+    assert Contact.get_by_id(contact.id).created_at == "2020-01-01 00:00:00"
+
+def test_delete_many_accepts_instances_and_ids(db):
+    contacts = [Contact(name=f"c{i}") for i in range(4)]
+    Contact.save_many(contacts)
+
+    deleted = Contact.delete_many([contacts[0], contacts[1].id, None])
+
+    assert deleted == 2
+    assert sorted(names()) == [contacts[2].id, contacts[3].id]
@@ -0,0 +1,45 @@
+import pytest
+
+from tracker.core import storage
+from tracker.core.models import Contact, Document, identity_map
+
+@pytest.fixture
+def database_storage(db):
+    previous = storage.get_storage()
+    storage.set_storage(storage.DatabaseStorage())
+    yield
+    storage.set_storage(previous)
+
+def cached_blobs():
+    return [instance for entries in identity_map._items.values() for instance in entries.values()
+            if instance.__dict__.get("file_content") is not None]
+
+def test_loading_content_does_not_pin_blob(database_storage):
+    document = Document(name="cv", type="Resume")
+    document.set_content(b"x" * (3 * 1024 * 1024))
+    document.save()
+    document_id = document.id
+
+    cached = Document.get_by_id(document_id, columns=Document.SUMMARY_COLUMNS)
+    assert len(cached.get_content()) == 3 * 1024 * 1024
+    assert cached_blobs() == []
+    assert Document.get_by_id(document_id, columns=Document.SUMMARY_COLUMNS) is not cached
+    assert cached_blobs() == []
+
+def test_unsaved_edits_do_not_leak(db):
+    contact = Contact(name="Ada")
+    contact.save()
+
+    edited = Contact.get_by_id(contact.id)
+    edited.name = "changed-not-saved"
+    assert Contact.get_by_id(contact.id).name == "Ada"
+
+def test_full_row_never_served_from_projection(db):
+    contact = Contact(name="Ada", company="Analytical Engines")
+    contact.save()
+
+    partial = Contact.get_by_id(contact.id, columns=("name",))
+    assert "company" not in partial.__dict__
+    full = Contact.get_by_id(contact.id)
+    assert full.__dict__["company"] == "Analytical Engines"
+    assert "_deferred" not in full.__dict__
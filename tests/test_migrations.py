@@ -0,0 +1,86 @@
+import sqlite3
+
+import pytest
+
+from tracker.core import database
+from tracker.core.models import Contact, Reminder
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """A database as written before schema versioning, with user_version 0"""
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE outreaches (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, company TEXT,
+                                 title TEXT, linkedin_url TEXT);
+        CREATE TABLE reminders (id INTEGER PRIMARY KEY AUTOINCREMENT, related_type TEXT,
+                                related_id INTEGER, title TEXT, description TEXT, due_date TEXT,
+                                status TEXT DEFAULT 'pending');
+        CREATE TABLE documents (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, type TEXT,
+                                version TEXT, file_content BLOB, file_type TEXT, notes TEXT);
+        INSERT INTO outreaches (name, company) VALUES ('Ada Lovelace', 'Analytical Engines');
+        INSERT INTO reminders (title, due_date) VALUES ('Follow up', '03/14/2024');
+        INSERT INTO reminders (title, due_date) VALUES ('Already ISO', '2024-05-01');
+    ''')
+    conn.close()
+    database.configure_database(path)
+    yield
+    database.close_connections()
+
+def columns(table):
+    return {row[1] for row in database.get_connection().execute(f"PRAGMA table_info({table})")}
+
+def indexes():
+    rows = database.get_connection().execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    return {row[0] for row in rows}
+
+def test_upgrades_legacy_database_to_latest(legacy_db):
+    assert database.schema_version() == 0
+
+    database.create_tables()
+
+    assert database.schema_version() == database.latest_version()
+    assert {"status", "notes", "email", "last_response"} <= columns("outreaches")
+    assert {"content_hash", "file_size"} <= columns("documents")
+    assert {"applications", "message_templates", "document_usage", "app_state"} <= {
+        row[0] for row in database.get_connection().execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    assert {"idx_reminders_status_due", "idx_outreaches_company", "idx_outreaches_notes"} <= indexes()
+    assert [r.due_date for r in Reminder.find_all(order_by="id")] == ["2024-03-14", "2024-05-01"]
+    assert Contact.get_by_id(1).name == "Ada Lovelace"
+
+def test_existing_rows_are_searchable_after_upgrade(legacy_db):
+    database.create_tables()
+    if database.fts_table("outreaches"):
+        assert [c.name for c in Contact.search("analyt")] == ["Ada Lovelace"]
+
+def test_target_version_stops_early_and_resumes(legacy_db):
+    database.migrate_schema(target_version=2)
+    assert database.schema_version() == 2
+    assert "idx_reminders_status_due" not in indexes()
+
+    database.migrate_schema()
+    assert database.schema_version() == database.latest_version()
+    assert "idx_reminders_status_due" in indexes()
+
+def test_current_schema_is_a_single_pragma_read(db):
+    statements = []
+    db.set_trace_callback(statements.append)
+    database.create_tables()
+    db.set_trace_callback(None)
+    assert statements == ["PRAGMA user_version"]
+
+def test_failed_migration_rolls_back_with_its_version(legacy_db, monkeypatch):
+    def broken(cursor):
+        cursor.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("boom")
+
+    migrations = [m if m[0] != 3 else (3, broken) for m in database.MIGRATIONS]
+    monkeypatch.setattr(database, "MIGRATIONS", migrations)
+    with pytest.raises(RuntimeError):
+        database.migrate_schema()
+
+    assert database.schema_version() == 2
+    assert "half_done" not in {
+        row[0] for row in database.get_connection().execute("SELECT name FROM sqlite_master")
+    }
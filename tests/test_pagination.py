@@ -0,0 +1,52 @@
+import pytest
+
+from tracker.core.models import Contact
+
+COMPANIES = ["Beta", "Alpha", None, "Beta", "Alpha", "Gamma", None, "Beta", "Alpha"]
+
+@pytest.fixture
+def contacts(db):
+    rows = [Contact(name=f"c{i}", company=company) for i, company in enumerate(COMPANIES)]
+    Contact.save_many(rows)
+    return rows
+
+def expected(descending):
+    rows = sorted(enumerate(COMPANIES, start=1), key=lambda row: (row[1] is not None, row[1] or "", row[0]))
+    ids = [row_id for row_id, _ in rows]
+    return ids[::-1] if descending else ids
+
+def page_through(page_size, descending):
+    ids = []
+    page = Contact.find_all(order_by="company", descending=descending, limit=page_size)
+    while page:
+        ids.extend(contact.id for contact in page)
+        page = Contact.find_all(order_by="company", descending=descending, limit=page_size, after=page[-1])
+    return ids
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("page_size", [1, 2, 4, 20])
+def test_keyset_pages_cover_every_row_once_in_order(contacts, page_size, descending):
+    assert page_through(page_size, descending) == expected(descending)
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_matches_offset_pages(contacts, descending):
+    by_offset = []
+    for offset in range(0, len(COMPANIES), 2):
+        page = Contact.find_all(order_by="company", descending=descending, limit=2, offset=offset)
+        by_offset.extend(contact.id for contact in page)
+    assert by_offset == expected(descending)
+
+def test_keyset_by_id(contacts):
+    page = Contact.find_all(limit=3, after=Contact.get_by_id(4))
+    assert [contact.id for contact in page] == [5, 6, 7]
+
+def test_offset_without_limit(contacts):
+    assert [contact.id for contact in Contact.find_all(offset=6)] == [7, 8, 9]
+
+def test_after_and_offset_cannot_be_combined(contacts):
+    with pytest.raises(ValueError):
+        Contact.find_all(limit=2, after=Contact.get_by_id(1), offset=2)
+
+def test_unknown_order_column_is_rejected(contacts):
+    with pytest.raises(ValueError):
+        Contact.find_all(order_by="company; DROP TABLE outreaches")
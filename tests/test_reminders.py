@@ -0,0 +1,52 @@
+from datetime import date
+
+import pytest
+
+from tracker.core.models import Application, Contact, Reminder
+
+@pytest.fixture
+def reminders(db):
+    contact = Contact(name="Ada Lovelace", company="Analytical Engines")
+    contact.save()
+    freelancer = Contact(name="Grace Hopper", company="")
+    freelancer.save()
+    application = Application(title="Engineer", name="Initech")
+    application.save()
+
+    def add(title, related_type, related_id, due_date, status="pending"):
+        reminder = Reminder(title=title, related_type=related_type, related_id=related_id,
+                            due_date=due_date, status=status)
+        reminder.save()
+        return reminder
+
+    return [
+        add("follow up", "contact", contact.id, "2026-03-02"),
+        add("thank you", "contact", freelancer.id, "2026-03-01", status="completed"),
+        add("check status", "application", application.id, "2026-03-01"),
+        add("orphan", "contact", 9999, "2026-03-05"),
+    ]
+
+def test_related_names_come_from_the_join(reminders):
+    names = {reminder.title: reminder.related_name for reminder in Reminder.query()}
+
+    assert names == {
+        "follow up": "Ada Lovelace at Analytical Engines",
+        "thank you": "Grace Hopper",
+        "check status": "Engineer at Initech",
+        "orphan": "",
+    }
+
+def test_results_are_ordered_by_due_date_then_id(reminders):
+    follow_up, thank_you, check_status, orphan = reminders
+
+    assert [r.id for r in Reminder.query()] == [thank_you.id, check_status.id, follow_up.id, orphan.id]
+
+def test_filters_combine(reminders):
+    follow_up, thank_you, check_status, orphan = reminders
+
+    assert [r.id for r in Reminder.query("pending")] == [check_status.id, follow_up.id, orphan.id]
+    assert [r.id for r in Reminder.query(due_from=date(2026, 3, 2))] == [follow_up.id, orphan.id]
+    assert [r.id for r in Reminder.query(due_to="2026-03-01")] == [thank_you.id, check_status.id]
+    assert [r.id for r in Reminder.query("pending", date(2026, 3, 1), date(2026, 3, 2))] == \
+        [check_status.id, follow_up.id]
+    assert Reminder.query("snoozed") == []
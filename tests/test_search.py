@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from tracker.core import database
+from tracker.core.models import Contact, MessageTemplate
+
+pytestmark = pytest.mark.skipif(not database.fts5_available(sqlite3.connect(":memory:").cursor()),
+                                reason="SQLite was built without FTS5")
+
+@pytest.fixture(params=["fts", "like"])
+def contacts(request, db, monkeypatch):
+    if request.param == "like":
+        monkeypatch.setattr(database, "_fts_tables", set())
+    Contact.save_many([
+        Contact(name="Ada Lovelace", company="Analytical Engines", status="✅ Connected"),
+        Contact(name="Grace Hopper", company="Navy", notes="compiler pioneer", status="💬 Messaged"),
+        Contact(name="Alan Turing", company="Bletchley", status="✅ Connected"),
+    ])
+    return request.param
+
+def found(*args, **kwargs):
+    return sorted(contact.name for contact in Contact.search(*args, **kwargs))
+
+def test_matches_any_search_column(contacts):
+    assert found("navy") == ["Grace Hopper"]
+    assert found("compiler") == ["Grace Hopper"]
+
+def test_every_word_must_match(contacts):
+    if contacts == "like":
+        # The fallback matches the text as one substring
+        assert found("lovelace") == ["Ada Lovelace"]
+        assert found("ada engines") == []
+    else:
+        assert found("ada engines") == ["Ada Lovelace"]
+        assert found("ada navy") == []
+
+def test_where_clause_and_limit(contacts):
+    assert found("a", "status = ?", ("✅ Connected",)) == ["Ada Lovelace", "Alan Turing"]
+    assert len(Contact.search("a", limit=1)) == 1
+
+def test_order_by_replaces_ranking(contacts):
+    results = [contact.name for contact in Contact.search("a", order_by="name", descending=True)]
+    assert results[:2] == (["Grace Hopper", "Alan Turing"] if contacts == "like" else ["Alan Turing", "Ada Lovelace"])
+
+def test_empty_text_returns_everything(contacts):
+    assert len(Contact.search("  ")) == 3
+
+def test_quotes_and_punctuation_are_harmless(contacts):
+    # Neither reaches FTS5 as query syntax
+    assert found('ada" OR "navy') == []
+    assert found("-- ;") == []
+
+def test_prefix_matching_uses_the_index(db):
+    assert database.fts_table("outreaches") == "outreaches_fts"
+    Contact(name="Katherine Johnson").save()
+    assert found("kath") == ["Katherine Johnson"]
+
+def test_index_follows_updates_and_deletes(db):
+    template = MessageTemplate(name="Follow up", content="Thanks for connecting")
+    template.save()
+    template.content = "Great meeting you"
+    template.save()
+
+    assert MessageTemplate.search("connecting") == []
+    assert [t.id for t in MessageTemplate.search("meeting")] == [template.id]
+    template.delete()
+    assert MessageTemplate.search("meeting") == []
@@ -0,0 +1,31 @@
+import importlib.util
+import os
+import statistics
+
+import pytest
+
+from tracker.core import database
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "startup.py")
+ROWS = 50000
+RUNS = 3
+
+def load_benchmark():
+    spec = importlib.util.spec_from_file_location("startup_benchmark", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.mark.slow
+def test_headless_startup_is_within_budget(tmp_path):
+    startup = load_benchmark()
+    db_path = str(tmp_path / "startup.db")
+    try:
+        startup.populate(db_path, ROWS)
+    finally:
+        database.close_connections()
+
+    startup.run_once(db_path, with_window=False)
+    totals = [startup.run_once(db_path, with_window=False)[0] for _ in range(RUNS)]
+
+    assert statistics.median(totals) <= startup.HEADLESS_BUDGET_MS
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from tracker.core import storage
+from tracker.core.models import Document
+
+@pytest.fixture
+def blob_store(db, tmp_path):
+    store = storage.ContentAddressedStorage(str(tmp_path / "blobs"))
+    previous = storage.get_storage()
+    storage.set_storage(store)
+    yield store
+    storage.set_storage(previous)
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def stored_files(store):
+    return sorted(name for _, _, names in os.walk(store.root) for name in names)
+
+def test_put_is_content_addressed_and_deduplicated(blob_store):
+    first = blob_store.put(b"same bytes")
+    second = blob_store.put(b"same bytes")
+
+    assert first == second == storage.hash_content(b"same bytes")
+    assert stored_files(blob_store) == [first]
+    with blob_store.read(first) as content:
+        assert bytes(content) == b"same bytes"
+
+def test_put_file_streams_and_matches_put(blob_store, tmp_path):
+    data = os.urandom(storage.CHUNK_SIZE * 2 + 123)
+    progress = []
+
+    content_hash, size = blob_store.put_file(write(tmp_path, "upload.bin", data),
+                                             lambda done, total: progress.append((done, total)))
+
+    assert (content_hash, size) == (storage.hash_content(data), len(data))
+    assert progress[0] == (0, len(data)) and progress[-1] == (len(data), len(data))
+    assert blob_store.put(data) == content_hash
+    assert stored_files(blob_store) == [content_hash]
+
+def test_release_keeps_content_still_referenced(blob_store, tmp_path):
+    path = write(tmp_path, "cv.pdf", b"%PDF shared")
+    first, second = Document(name="a"), Document(name="b")
+    first.import_file(path)
+    second.import_file(path)
+    assert stored_files(blob_store) == [first.content_hash]
+
+    first.delete()
+    assert blob_store.exists(second.content_hash)
+    second.delete()
+    assert stored_files(blob_store) == []
+
+def test_replacing_content_releases_the_old_blob(blob_store, tmp_path):
+    document = Document(name="cv")
+    document.import_file(write(tmp_path, "v1.pdf", b"version 1"))
+    old_hash = document.content_hash
+
+    document.import_file(write(tmp_path, "v2.pdf", b"version 2"))
+
+    assert not blob_store.exists(old_hash)
+    assert stored_files(blob_store) == [document.content_hash]
+    assert Document.get_by_id(document.id).get_content() == b"version 2"
+
+def test_failed_save_releases_the_new_blob(blob_store, tmp_path, monkeypatch):
+    def fail(self):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(Document, "save", fail)
+
+    with pytest.raises(RuntimeError):
+        Document(name="cv").import_file(write(tmp_path, "cv.pdf", b"never saved"))
+    assert stored_files(blob_store) == []
+
+def test_legacy_blobs_move_once(blob_store):
+    storage.set_storage(storage.DatabaseStorage())
+    legacy = Document(name="legacy")
+    legacy.set_content(b"in the database")
+    legacy.save()
+    storage.set_storage(blob_store)
+
+    assert storage.migrate_document_blobs() == 1
+    assert storage.migrate_document_blobs() == 0
+    assert Document.get_by_id(legacy.id).get_content() == b"in the database"
+    assert stored_files(blob_store) == [storage.hash_content(b"in the database")]
+
+def test_migration_marker_is_cleared_by_a_legacy_write(blob_store, db):
+    def marker():
+        row = db.execute("SELECT value FROM app_state WHERE key = ?",
+                         (storage.BLOBS_MIGRATED_KEY,)).fetchone()
+        return row[0] if row else None
+
+    storage.migrate_document_blobs()
+    assert marker() == blob_store.name
+
+    storage.set_storage(storage.DatabaseStorage())
+    legacy = Document(name="late")
+    legacy.set_content(b"written by an older build")
+    legacy.save()
+    storage.set_storage(blob_store)
+    assert marker() is None
+
+    assert storage.migrate_document_blobs() == 1
+    assert marker() == blob_store.name
@@ -1,27 +1,183 @@
 import sqlite3
+import threading
+from contextlib import contextmanager
 
-REQUIRED_COLUMNS = {
-    "outreaches": [
-        ("last_response", "TEXT"),
-        ("status", "TEXT"),
-        ("notes", "TEXT"),
-        ("email", "TEXT")
-    ],
-    "applications": [
-        ("title", "TEXT"),
-        ("application_link", "TEXT"),
-        ("status", "TEXT"),
-        ("notes", "TEXT")
-    ]
+DB_PATH = "outreach_tracker.db"
+STATEMENT_CACHE_SIZE = 256
+
+# Pragmas applied to every connection. All profiles use WAL, which is a
+# property of the database file, so readers never wait on a writer and a
+# commit appends to the log instead of rewriting pages. They differ in how
+# much durability they trade for speed:
+#   safe         fsync on every commit (survives power loss)
+#   fast         fsync at checkpoints only; a crash of the process loses
+#                nothing, a power cut may drop the last commits
+#   bulk-import  no fsync at all, for one-off imports of data that can be
+#                imported again
+PROFILES = {
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "bulk-import": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
 }
+DEFAULT_PROFILE = "safe"
+
+class ConnectionManager:
+    """Hands out one long-lived SQLite connection per thread"""
+
+    def __init__(self, path=DB_PATH, cached_statements=STATEMENT_CACHE_SIZE, profile=DEFAULT_PROFILE):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.profile = profile
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def connect(self):
+        """Return the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # sqlite3 keeps a per-connection LRU of prepared statements, so a
+            # persistent connection reuses compiled SQL across calls.
+            conn = sqlite3.connect(
+                self.path,
+                cached_statements=self.cached_statements,
+                check_same_thread=False
+            )
+            apply_profile(conn, self.profile)
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._connections[threading.get_ident()] = conn
+        return conn
+
+    @contextmanager
+    def transaction(self, immediate=True):
+        """
+        Run a block inside a transaction on the thread's connection
+
+        Nested blocks join the outermost transaction, which commits on a
+        clean exit and rolls back if an exception escapes. Transactions
+        take the write lock up front unless `immediate` is false: a deferred
+        one that reads and then writes gets SQLITE_BUSY on the lock upgrade
+        without waiting out the busy timeout.
+        """
+        conn = self.connect()
+        if self._local.depth == 0 and not conn.in_transaction:
+            # Explicit BEGIN so DDL and reads are covered too, not just DML
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.rollback()
+            raise
+        else:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.commit()
+
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            with self._lock:
+                self._connections.pop(threading.get_ident(), None)
+            conn.close()
+
+    def close_all(self):
+        """Close every connection handed out by this manager"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+        self._local = threading.local()
+
+    def configure(self, path=None, profile=None):
+        """Point the manager at a different database file or connection profile"""
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f"Unknown database profile: {profile}")
+        self.close_all()
+        if path is not None:
+            self.path = path
+        if profile is not None:
+            self.profile = profile
+
+def apply_profile(conn, profile):
+    """Set the pragmas of connection profile `profile` on `conn`"""
+    for pragma, value in PROFILES[profile].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+_manager = ConnectionManager()
 
 def get_connection():
-    return sqlite3.connect("outreach_tracker.db")
+    """Return the persistent connection for the current thread"""
+    return _manager.connect()
 
-def create_tables():
-    conn = get_connection()
-    cursor = conn.cursor()
+def transaction(immediate=True):
+    """Context manager yielding a connection that commits on success"""
+    return _manager.transaction(immediate)
 
+def close_connections():
+    """Close all open connections, e.g. when the application exits"""
+    _manager.close_all()
+
+def configure_database(path=None, profile=None):
+    """
+    Use the database at `path` and/or connection profile `profile` for all
+    subsequent connections
+
+    Open connections are closed, so call this before handing work to the
+    database worker.
+    """
+    _manager.configure(path, profile)
+    _forget_fts_tables()
+
+MIGRATIONS = []
+
+def migration(version):
+    """Register a schema migration that upgrades the database to `version`"""
+    def register(func):
+        MIGRATIONS.append((version, func))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return func
+    return register
+
+def _column_names(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return [col[1] for col in cursor.fetchall()]
+
+def _add_column_if_missing(cursor, table, column_name, column_type):
+    if column_name not in _column_names(cursor, table):
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+
+@migration(1)
+def _create_base_tables(cursor):
+    """Base schema, also upgrading databases created before versioning existed"""
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS outreaches (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -74,7 +230,7 @@ def create_tables():
             name TEXT,
             type TEXT,  -- 'resume', 'cover_letter', 'other'
             version TEXT,
-            file_content BLOB,
+            file_content BLOB,  -- only used when documents are stored in the database
             file_type TEXT,  -- 'pdf', 'docx', etc.
             notes TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -104,21 +260,191 @@ def create_tables():
         )
     ''')
 
-    conn.commit()
-    conn.close()
+    # Columns added to early databases after their tables were first created
+    for column_name in ("last_response", "status", "notes", "email"):
+        _add_column_if_missing(cursor, "outreaches", column_name, "TEXT")
+    for column_name in ("title", "application_link", "status", "notes"):
+        _add_column_if_missing(cursor, "applications", column_name, "TEXT")
+
+@migration(2)
+def _add_document_storage_columns(cursor):
+    """Content hash and size for documents kept in the blob store"""
+    _add_column_if_missing(cursor, "documents", "content_hash", "TEXT")  # SHA-256, blob store key
+    _add_column_if_missing(cursor, "documents", "file_size", "INTEGER")
+
+@migration(3)
+def _add_lookup_indexes(cursor):
+    """Indexes for the status filters, reminder lookups and document links"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_document_usage_related
+        ON document_usage (related_type, related_id, document_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_document_usage_document
+        ON document_usage (document_id, related_type, related_id)
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reminders_status_due ON reminders (status, due_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reminders_related ON reminders (related_type, related_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_outreaches_status ON outreaches (status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents (content_hash)")
+
+@migration(4)
+def _normalize_reminder_due_dates(cursor):
+    """Rewrite mm/dd/yyyy reminder due dates as ISO-8601 so ranges can use an index"""
+    cursor.execute('''
+        UPDATE reminders
+        SET due_date = substr(due_date, 7, 4) || '-' || substr(due_date, 1, 2) || '-' || substr(due_date, 4, 2)
+        WHERE due_date GLOB '[0-9][0-9]/[0-9][0-9]/[0-9][0-9][0-9][0-9]'
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due_date)")
+
+# Full-text indexes: table -> indexed columns. The FTS5 tables use the
+# source table as external content, so they only store the index itself.
+FTS_TABLES = {
+    "outreaches": ("name", "company", "title", "email", "linkedin_url", "notes"),
+    "applications": ("title", "name", "application_link", "notes"),
+    "message_templates": ("name", "content"),
+    "documents": ("name", "version", "notes"),
+}
+
+def fts5_available(cursor):
+    """Return True if this SQLite build includes the FTS5 extension"""
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        cursor.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+# Full-text index names present in the database, looked up once; they only
+# change when migrations run or another database is configured
+_fts_tables = None
+
+def fts_table(table):
+    """Name of the full-text index for `table`, or None if it has none"""
+    global _fts_tables
+    if _fts_tables is None:
+        rows = get_connection().execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        _fts_tables = {row[0] for row in rows} & {f"{name}_fts" for name in FTS_TABLES}
+    name = f"{table}_fts"
+    return name if name in _fts_tables else None
+
+def _forget_fts_tables():
+    global _fts_tables
+    _fts_tables = None
+
+@migration(5)
+def _create_search_indexes(cursor):
+    """FTS5 indexes for contact, application, template and document search"""
+    if not fts5_available(cursor):
+        # Searches fall back to LIKE scans when the extension is missing
+        return
+
+    for table, columns in FTS_TABLES.items():
+        fts = f"{table}_fts"
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {column_list},
+                content='{table}', content_rowid='id',
+                prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts} (rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {column_list} ON {table} BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts} (rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+@migration(6)
+def _add_sort_indexes(cursor):
+    """Indexes for the sortable list columns, so sorted pages are read in index order"""
+    sort_columns = {
+        "outreaches": ("name", "company", "title", "email", "linkedin_url", "last_response"),
+        "applications": ("title", "name", "application_link", "updated_at"),
+    }
+    for table, columns in sort_columns.items():
+        for column in columns:
+            # The rowid is part of every index entry, so this also covers ORDER BY column, id
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})")
+
+@migration(7)
+def _add_notes_sort_indexes(cursor):
+    """Index notes too, which both lists can also be sorted by"""
+    for table in ("outreaches", "applications"):
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_notes ON {table} (notes)")
+
+@migration(8)
+def _add_app_state(cursor):
+    """
+    Key/value table for one-off maintenance state
+
+    `document_blobs_migrated` records which storage backend the document
+    BLOB sweep last completed for. Any row written with file_content
+    clears it, so the sweep only scans again when there is work to do.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS app_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+    for event in ("INSERT", "UPDATE OF file_content"):
+        name = "documents_content_" + event.split()[0].lower()
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON documents
+            WHEN new.file_content IS NOT NULL BEGIN
+                DELETE FROM app_state WHERE key = 'document_blobs_migrated';
+            END
+        ''')
+
+def schema_version():
+    """Return the schema version recorded in the database"""
+    return get_connection().execute("PRAGMA user_version").fetchone()[0]
+
+def latest_version():
+    """Return the version of the newest registered migration"""
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+def create_tables():
+    """Create or upgrade the database schema to the latest version"""
     migrate_schema()
 
-def migrate_schema():
-    conn = get_connection()
-    cursor = conn.cursor()
+def migrate_schema(target_version=None):
+    """
+    Apply every registered migration newer than the stored PRAGMA user_version
 
-    for table, columns in REQUIRED_COLUMNS.items():
-        cursor.execute(f"PRAGMA table_info({table})")
-        existing_columns = [col[1] for col in cursor.fetchall()]
+    Each migration runs in its own transaction together with the version
+    bump, so an interrupted upgrade resumes from the last completed step.
+    """
+    current_version = schema_version()
+    if current_version >= (latest_version() if target_version is None else target_version):
+        # Warm start: the single pragma read is the only schema work
+        return
 
-        for column_name, column_type in columns:
-            if column_name not in existing_columns:
-                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+    for version, migrate in MIGRATIONS:
+        if version <= current_version:
+            continue
+        if target_version is not None and version > target_version:
+            break
 
-    conn.commit()
-    conn.close()
\ No newline at end of file
+        with transaction() as conn:
+            migrate(conn.cursor())
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        _forget_fts_tables()
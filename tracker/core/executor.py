@@ -0,0 +1,39 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DATABASE = "database"
+RENDER = "render"
+
+_executors = {}
+_lock = threading.Lock()
+
+def get_executor(pool: str = DATABASE) -> ThreadPoolExecutor:
+    """
+    Return the single-worker executor for `pool`
+
+    DATABASE runs database work off the Tk thread, in submission order and
+    on that thread's persistent connection. RENDER rasterizes previews so
+    CPU-heavy rendering never delays a query.
+    """
+    with _lock:
+        executor = _executors.get(pool)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"tracker-{pool}")
+            _executors[pool] = executor
+        return executor
+
+def submit(func, *args, **kwargs) -> Future:
+    """Queue `func(*args, **kwargs)` on the database worker"""
+    return get_executor().submit(func, *args, **kwargs)
+
+def submit_to(pool: str, func, *args, **kwargs) -> Future:
+    """Queue `func(*args, **kwargs)` on the worker of `pool`"""
+    return get_executor(pool).submit(func, *args, **kwargs)
+
+def shutdown(wait: bool = True) -> None:
+    """Stop all workers, dropping jobs that have not started yet"""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
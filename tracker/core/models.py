@@ -1,70 +1,387 @@
+import inspect
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, asdict, field
-from datetime import datetime
-from typing import List, Optional, Dict, Any, ClassVar, Type, TypeVar
-from tracker.core.database import get_connection
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Callable, ClassVar, Sequence, Type, TypeVar
+import re
+from tracker.core.database import get_connection, transaction, fts_table
+from tracker.core.storage import (get_storage, hash_content, open_content, export_content, release_content,
+                                  content_path)
 
 T = TypeVar('T', bound='BaseModel')
 
+IDENTITY_MAP_SIZE = 512
+
+class IdentityMap:
+    """
+    Bounded LRU cache of model rows keyed by table, ID and projection
+    
+    Repeated get_by_id calls for the same row are answered without touching
+    the database. Every caller gets its own copy of the cached instance, so
+    unsaved edits and lazily loaded fields never leak into the cache. A
+    cached full row also answers narrower projections. Entries are dropped
+    when the row is saved or deleted through the models.
+    """
+    
+    def __init__(self, max_size: int = IDENTITY_MAP_SIZE):
+        self.max_size = max_size
+        self._items: 'OrderedDict[tuple, Dict[Optional[frozenset], BaseModel]]' = OrderedDict()
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def _key(cls, id) -> tuple:
+        try:
+            id = int(id)
+        except (TypeError, ValueError):
+            pass
+        return (cls.table_name, id)
+    
+    @staticmethod
+    def _projection(cls, columns: Optional[Sequence[str]]) -> Optional[frozenset]:
+        # None stands for the full row
+        return frozenset(columns) | {cls.id_column} if columns else None
+    
+    @staticmethod
+    def _copy(instance: 'BaseModel') -> 'BaseModel':
+        copy = type(instance).__new__(type(instance))
+        copy.__dict__.update(instance.__dict__)
+        return copy
+    
+    def get(self, cls, id, columns: Optional[Sequence[str]] = None) -> Optional['BaseModel']:
+        key = self._key(cls, id)
+        with self._lock:
+            entries = self._items.get(key)
+            if not entries:
+                return None
+            instance = entries.get(self._projection(cls, columns)) or entries.get(None)
+            if instance is None:
+                return None
+            self._items.move_to_end(key)
+            return self._copy(instance)
+    
+    def add(self, instance: 'BaseModel', columns: Optional[Sequence[str]] = None) -> None:
+        # Never pin large payloads such as in-database file contents
+        if any(instance.__dict__.get(name) is not None for name in instance.large_columns):
+            return
+        key = self._key(type(instance), instance.id)
+        with self._lock:
+            entries = self._items.setdefault(key, {})
+            entries[self._projection(type(instance), columns)] = self._copy(instance)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+    
+    def discard(self, cls, *ids) -> None:
+        with self._lock:
+            for id in ids:
+                self._items.pop(self._key(cls, id), None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+identity_map = IdentityMap()
+
 class BaseModel:
     """Base model class with common database operations"""
     table_name: ClassVar[str] = ""
     id_column: ClassVar[str] = "id"
+    # Deferred columns that are only fetched when they themselves are read
+    large_columns: ClassVar[tuple] = ()
+    # Text columns matched by search(); indexed with FTS5 where available
+    search_columns: ClassVar[tuple] = ()
     
     id: Optional[int] = None
     
     @classmethod
-    def get_by_id(cls: Type[T], id: int) -> Optional[T]:
-        """Fetch a record by its ID"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def get_by_id(cls: Type[T], id: int, columns: Optional[Sequence[str]] = None) -> Optional[T]:
+        """
+        Fetch a record by its ID
+        
+        Passing `columns` loads only those fields; the rest are fetched
+        lazily the first time one of them is accessed. Repeated lookups are
+        served from the identity map, each as a separate instance.
+        """
+        cached = identity_map.get(cls, id, columns)
+        if cached is not None:
+            return cached
         
-        cursor.execute(f"SELECT * FROM {cls.table_name} WHERE {cls.id_column} = ?", (id,))
+        cursor = get_connection().cursor()
+        
+        cursor.execute(
+            f"SELECT {cls._select_list(columns)} FROM {cls.table_name} WHERE {cls.id_column} = ?", 
+            (id,)
+        )
         row = cursor.fetchone()
-        conn.close()
         
         if not row:
             return None
-            
-        columns = [col[0] for col in cursor.description]
-        data = {columns[i]: row[i] for i in range(len(columns))}
         
-        return cls(**data)
+        instance = cls._row_factory(cursor.description)(row)
+        identity_map.add(instance, columns)
+        return instance
     
     @classmethod
-    def find_all(cls: Type[T], where_clause: str = "", params: tuple = ()) -> List[T]:
-        """Find all records matching the criteria"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def find_all(cls: Type[T], where_clause: str = "", params: tuple = (),
+                 columns: Optional[Sequence[str]] = None, order_by: Optional[str] = None,
+                 descending: bool = False, limit: Optional[int] = None,
+                 after: Optional['BaseModel'] = None, offset: Optional[int] = None) -> List[T]:
+        """
+        Find all records matching the criteria, optionally loading only `columns`
+        
+        `order_by` sorts on one column, with ties broken by ID. `limit` fetches
+        a page, and the next page starts `after` the last instance of the
+        previous one (a keyset seek through the index) or at `offset` rows.
+        `after` and `offset` cannot be combined.
+        """
+        if after is not None and offset:
+            raise ValueError("find_all takes either after or offset, not both")
+        clauses = [f"({where_clause})"] if where_clause else []
+        params = tuple(params)
+        ordered = bool(order_by) or limit is not None or after is not None or bool(offset)
+        if after is None:
+            return cls._select(clauses, params, columns, ordered, order_by, descending, limit, offset)
+        
+        id_column = cls.id_column
+        op = "<" if descending else ">"
+        if not order_by or order_by == id_column:
+            return cls._select(clauses + [f"{id_column} {op} ?"], params + (after.id,),
+                               columns, True, order_by, descending, limit)
         
-        query = f"SELECT * FROM {cls.table_name}"
+        value = getattr(after, order_by)
+        # SQLite sorts NULLs before every other value
+        if value is None:
+            if descending:
+                condition = f"{order_by} IS NULL AND {id_column} < ?"
+            else:
+                condition = f"({order_by} IS NOT NULL OR {id_column} > ?)"
+            return cls._select(clauses + [condition], params + (after.id,),
+                               columns, True, order_by, descending, limit)
+        
+        # Row-value comparisons let SQLite seek straight to the next row
+        results = cls._select(clauses + [f"({order_by}, {id_column}) {op} (?, ?)"], params + (value, after.id),
+                              columns, True, order_by, descending, limit)
+        if descending and (limit is None or len(results) < limit):
+            # Descending, the NULLs come after every other value
+            remaining = None if limit is None else limit - len(results)
+            results += cls._select(clauses + [f"{order_by} IS NULL"], params,
+                                   columns, True, order_by, descending, remaining)
+        return results
+    
+    @classmethod
+    def _select(cls: Type[T], clauses: List[str], params: tuple, columns: Optional[Sequence[str]],
+                ordered: bool, order_by: Optional[str], descending: bool,
+                limit: Optional[int], offset: Optional[int] = None) -> List[T]:
+        """Run a SELECT built from AND-ed `clauses` and materialize the rows"""
+        query = f"SELECT {cls._select_list(columns)} FROM {cls.table_name}"
+        if clauses:
+            query += f" WHERE {' AND '.join(clauses)}"
+        if ordered:
+            query += cls._order_clause(order_by, descending)
+        if limit is not None or offset:
+            # SQLite only accepts OFFSET after a LIMIT; -1 means no limit
+            query += f" LIMIT {int(limit) if limit is not None else -1}"
+            if offset:
+                query += f" OFFSET {int(offset)}"
+        
+        cursor = get_connection().cursor()
+        cursor.execute(query, params)
+        return cls._fetch_all(cursor)
+    
+    @classmethod
+    def count(cls, where_clause: str = "", params: tuple = ()) -> int:
+        """Count the records matching the criteria"""
+        query = f"SELECT count(*) FROM {cls.table_name}"
         if where_clause:
             query += f" WHERE {where_clause}"
+        return get_connection().execute(query, params).fetchone()[0]
+    
+    @classmethod
+    def _order_clause(cls, order_by: Optional[str], descending: bool, alias: str = "") -> str:
+        """ORDER BY `order_by` then ID, so the order is total and pages are stable"""
+        prefix = f"{alias}." if alias else ""
+        direction = "DESC" if descending else "ASC"
+        columns = [cls.id_column]
+        if order_by and order_by != cls.id_column:
+            if order_by not in cls.field_names():
+                raise ValueError(f"Cannot order {cls.__name__} by unknown column {order_by!r}")
+            columns.insert(0, order_by)
+        return " ORDER BY " + ", ".join(f"{prefix}{column} {direction}" for column in columns)
+    
+    @classmethod
+    def search(cls: Type[T], text: str, where_clause: str = "", params: tuple = (),
+               columns: Optional[Sequence[str]] = None, limit: Optional[int] = None,
+               order_by: Optional[str] = None, descending: bool = False) -> List[T]:
+        """
+        Find records whose search columns contain words starting with `text`
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        Every word in `text` must match (as a prefix) and results are ranked
+        by relevance unless `order_by` is given. `where_clause` and `params`
+        filter further, as in find_all, and `limit` keeps only the first
+        matches. An empty `text` is the same as find_all.
+        """
+        match = cls._match_expression(text)
+        fts = fts_table(cls.table_name) if match else None
+        if not fts:
+            return cls._search_like(text, where_clause, params, columns, limit, order_by, descending)
         
-        result = []
-        if rows:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                data = {columns[i]: row[i] for i in range(len(columns))}
-                result.append(cls(**data))
+        query = f'''
+            SELECT {cls._select_list(columns, "t")} FROM {cls.table_name} t
+            JOIN (SELECT rowid, rank FROM {fts} WHERE {fts} MATCH ?) m ON m.rowid = t.{cls.id_column}
+        '''
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        query += cls._order_clause(order_by, descending, "t") if order_by else " ORDER BY m.rank"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
         
-        conn.close()
-        return result
+        cursor = get_connection().cursor()
+        cursor.execute(query, (match,) + tuple(params))
+        return cls._fetch_all(cursor)
+    
+    @staticmethod
+    def _match_expression(text: str) -> str:
+        """Turn user input into an FTS5 query of quoted prefix terms"""
+        words = [word for word in text.split() if re.search(r"\w", word)]
+        return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+    
+    @classmethod
+    def _search_like(cls: Type[T], text: str, where_clause: str, params: tuple,
+                     columns: Optional[Sequence[str]], limit: Optional[int] = None,
+                     order_by: Optional[str] = None, descending: bool = False) -> List[T]:
+        """Substring search used when there is no full-text index"""
+        text = text.strip()
+        if text and cls.search_columns:
+            clauses = [f"({' OR '.join(f'{column} LIKE ?' for column in cls.search_columns)})"]
+            if where_clause:
+                clauses.append(f"({where_clause})")
+            where_clause = " AND ".join(clauses)
+            params = (f"%{text}%",) * len(cls.search_columns) + tuple(params)
+        
+        return cls.find_all(where_clause, params, columns, order_by, descending, limit)
+    
+    @classmethod
+    def _select_list(cls, columns: Optional[Sequence[str]], alias: str = "") -> str:
+        """Build the SELECT column list for a projection, always including the ID"""
+        prefix = f"{alias}." if alias else ""
+        if not columns:
+            return f"{prefix}*"
+        
+        selected = list(columns)
+        if cls.id_column not in selected:
+            selected.insert(0, cls.id_column)
+        return ", ".join(f"{prefix}{column}" for column in selected)
+    
+    @classmethod
+    def field_names(cls) -> tuple:
+        """Names of the model's own columns, taken from its constructor"""
+        names = cls.__dict__.get('_field_names')
+        if names is None:
+            parameters = inspect.signature(cls.__init__).parameters.values()
+            names = tuple(p.name for p in parameters 
+                          if p.name != 'self' and p.kind is p.POSITIONAL_OR_KEYWORD)
+            cls._field_names = names
+        return names
+    
+    @classmethod
+    def _row_factory(cls: Type[T], description) -> Callable[[tuple], T]:
+        """
+        Return a function that turns result rows with this shape into instances
+        
+        Factories are compiled once per class and column list. They fill the
+        instance __dict__ straight from the row instead of going through
+        __init__, which is safe because model constructors only assign
+        fields. Model fields missing from the row are deferred; extra
+        columns, such as names pulled in by a join, become plain attributes
+        that are never written back.
+        """
+        columns = tuple(col[0] for col in description)
+        factories = cls.__dict__.get('_row_factories')
+        if factories is None:
+            factories = cls._row_factories = {}
+        
+        factory = factories.get(columns)
+        if factory is None:
+            deferred = frozenset(cls.field_names()) - set(columns)
+            new = cls.__new__
+            
+            if deferred:
+                def factory(row):
+                    instance = new(cls)
+                    instance.__dict__.update(zip(columns, row))
+                    instance.__dict__['_deferred'] = deferred
+                    return instance
+            else:
+                def factory(row):
+                    instance = new(cls)
+                    instance.__dict__.update(zip(columns, row))
+                    return instance
+            
+            factories[columns] = factory
+        return factory
+    
+    @classmethod
+    def _fetch_all(cls: Type[T], cursor) -> List[T]:
+        """Materialize every remaining row of an executed cursor as instances"""
+        if cursor.description is None:
+            return []
+        return list(map(cls._row_factory(cursor.description), cursor))
+    
+    def __getattr__(self, name: str) -> Any:
+        deferred = self.__dict__.get('_deferred')
+        if deferred and name in deferred:
+            if name in self.large_columns:
+                self._load_deferred([name])
+            else:
+                self._load_deferred([k for k in deferred if k not in self.large_columns])
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    def defer(self, *names: str) -> None:
+        """Forget loaded fields so they are read from the database again on next access"""
+        for name in names:
+            self.__dict__.pop(name, None)
+        self._deferred = frozenset(self.__dict__.get('_deferred', ())) | set(names)
+    
+    def _load_deferred(self, names: List[str]) -> None:
+        """Load fields that were left out of the original projection"""
+        deferred = sorted(names)
+        self._deferred = self._deferred - set(deferred)
+        if not self._deferred:
+            del self._deferred
+        
+        cursor = get_connection().cursor()
+        cursor.execute(
+            f"SELECT {', '.join(deferred)} FROM {self.table_name} WHERE {self.id_column} = ?",
+            (self.id,)
+        )
+        row = cursor.fetchone()
+        
+        for i, name in enumerate(deferred):
+            setattr(self, name, row[i] if row else None)
     
     def save(self) -> int:
         """Save or update the record"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        
         data = self.to_dict()
         
         if self.id:
-            update_data = {k: v for k, v in data.items() 
-                          if k not in [self.id_column, 'created_at']}
-            
-            update_data['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            identity_map.discard(type(self), self.id)
+        with transaction() as conn:
+            return self._write(conn.cursor(), data)
+    
+    def _update_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Columns written by an UPDATE of this record, with a fresh updated_at"""
+        update_data = {k: v for k, v in data.items() 
+                      if k not in [self.id_column, 'created_at']}
+        
+        update_data['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return update_data
+    
+    def _write(self, cursor, data: Dict[str, Any]) -> int:
+        """Issue the INSERT or UPDATE for this record on the given cursor"""
+        if self.id:
+            update_data = self._update_data(data)
             
             set_clause = ", ".join([f"{k} = ?" for k in update_data.keys()])
             values = list(update_data.values())
@@ -73,8 +390,6 @@ class BaseModel:
                 f"UPDATE {self.table_name} SET {set_clause} WHERE {self.id_column} = ?",
                 [*values, self.id]
             )
-            conn.commit()
-            conn.close()
             return self.id
         else:
             insert_data = {k: v for k, v in data.items() if k != self.id_column}
@@ -88,36 +403,124 @@ class BaseModel:
                 values
             )
             
-            cursor.execute("SELECT last_insert_rowid()")
-            new_id = cursor.fetchone()[0]
+            new_id = cursor.lastrowid
             self.id = new_id
             
-            conn.commit()
-            conn.close()
             return new_id
     
+    @classmethod
+    def save_many(cls: Type[T], objects: Sequence[T]) -> List[int]:
+        """
+        Insert or update many records in a single transaction
+        
+        Rows with the same set of loaded columns share one executemany call.
+        New records get their IDs assigned, relying on AUTOINCREMENT handing
+        out consecutive IDs within one transaction.
+        """
+        inserts: Dict[tuple, List[T]] = {}
+        updates: Dict[tuple, List[tuple]] = {}
+        identity_map.discard(cls, *[obj.id for obj in objects if obj.id])
+        
+        for obj in objects:
+            data = obj.to_dict()
+            if obj.id:
+                update_data = obj._update_data(data)
+                updates.setdefault(tuple(update_data), []).append((*update_data.values(), obj.id))
+            else:
+                insert_data = {k: v for k, v in data.items() if k != cls.id_column}
+                inserts.setdefault(tuple(insert_data), []).append(obj)
+        
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            for columns, rows in updates.items():
+                set_clause = ", ".join([f"{k} = ?" for k in columns])
+                cursor.executemany(
+                    f"UPDATE {cls.table_name} SET {set_clause} WHERE {cls.id_column} = ?",
+                    rows
+                )
+            
+            for columns, group in inserts.items():
+                placeholders = ", ".join(["?"] * len(columns))
+                cursor.executemany(
+                    f"INSERT INTO {cls.table_name} ({', '.join(columns)}) VALUES ({placeholders})",
+                    [[obj.__dict__[k] for k in columns] for obj in group]
+                )
+                last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                for offset, obj in enumerate(group):
+                    obj.id = last_id - len(group) + 1 + offset
+        
+        return [obj.id for obj in objects]
+    
+    @classmethod
+    def upsert_many(cls: Type[T], objects: Sequence[T]) -> List[int]:
+        """
+        Write many records in one transaction, inserting or replacing by ID
+        
+        Records that already carry an ID are created if missing and updated
+        otherwise; records without one are inserted as new rows.
+        """
+        new_objects = [obj for obj in objects if not obj.id]
+        upserts: Dict[tuple, List[tuple]] = {}
+        identity_map.discard(cls, *[obj.id for obj in objects if obj.id])
+        
+        for obj in objects:
+            if obj.id:
+                data = obj.to_dict()
+                data['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                upserts.setdefault(tuple(data), []).append(tuple(data.values()))
+        
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            for columns, rows in upserts.items():
+                placeholders = ", ".join(["?"] * len(columns))
+                assignments = ", ".join(f"{k} = excluded.{k}" for k in columns 
+                                        if k not in [cls.id_column, 'created_at'])
+                cursor.executemany(
+                    f"INSERT INTO {cls.table_name} ({', '.join(columns)}) VALUES ({placeholders}) "
+                    f"ON CONFLICT({cls.id_column}) DO UPDATE SET {assignments}",
+                    rows
+                )
+            
+            if new_objects:
+                cls.save_many(new_objects)
+        
+        return [obj.id for obj in objects]
+    
+    @classmethod
+    def delete_many(cls, objects_or_ids: Sequence[Any]) -> int:
+        """Delete many records, given as instances or IDs, in a single transaction"""
+        ids = [getattr(item, 'id', item) for item in objects_or_ids]
+        ids = [(item_id,) for item_id in ids if item_id]
+        identity_map.discard(cls, *[item_id for (item_id,) in ids])
+        
+        with transaction() as conn:
+            conn.executemany(f"DELETE FROM {cls.table_name} WHERE {cls.id_column} = ?", ids)
+        
+        return len(ids)
+    
     def delete(self) -> bool:
         """Delete the record"""
         if not self.id:
             return False
             
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(f"DELETE FROM {self.table_name} WHERE {self.id_column} = ?", (self.id,))
-        conn.commit()
-        conn.close()
+        identity_map.discard(type(self), self.id)
+        with transaction() as conn:
+            conn.execute(f"DELETE FROM {self.table_name} WHERE {self.id_column} = ?", (self.id,))
         
         return True
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary for database operations"""
-        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        fields = self.field_names()
+        return {k: v for k, v in self.__dict__.items() if k in fields}
 
 
 class Contact(BaseModel):
     """Model for outreach contacts"""
     table_name = "outreaches"
+    search_columns = ("name", "company", "title", "email", "linkedin_url", "notes")
     
     def __init__(self, id=None, name="", company="", title="", email="", linkedin_url="",
                  status="🔵 Not Connected", last_response="", notes="", created_at=None, updated_at=None, **kwargs):
@@ -133,9 +536,9 @@ class Contact(BaseModel):
         self.created_at = created_at
         self.updated_at = updated_at
     
-    def get_linked_documents(self) -> List['Document']:
+    def get_linked_documents(self, columns: Optional[Sequence[str]] = None) -> List['Document']:
         """Get all documents linked to this contact"""
-        return Document.find_related('contact', self.id)
+        return Document.find_related('contact', self.id, columns)
     
     def get_reminders(self) -> List['Reminder']:
         """Get all reminders for this contact"""
@@ -145,6 +548,7 @@ class Contact(BaseModel):
 class Application(BaseModel):
     """Model for job applications"""
     table_name = "applications"
+    search_columns = ("title", "name", "application_link", "notes")
     
     def __init__(self, id=None, title="", name="", application_link="",
                  status="📝 Not Applied", notes="", created_at=None, updated_at=None, **kwargs):
@@ -157,9 +561,9 @@ class Application(BaseModel):
         self.created_at = created_at
         self.updated_at = updated_at
     
-    def get_linked_documents(self) -> List['Document']:
+    def get_linked_documents(self, columns: Optional[Sequence[str]] = None) -> List['Document']:
         """Get all documents linked to this application"""
-        return Document.find_related('application', self.id)
+        return Document.find_related('application', self.id, columns)
     
     def get_reminders(self) -> List['Reminder']:
         """Get all reminders for this application"""
@@ -169,9 +573,16 @@ class Application(BaseModel):
 class Document(BaseModel):
     """Model for documents"""
     table_name = "documents"
+    search_columns = ("name", "version", "notes")
+    
+    large_columns = ("file_content",)
+    
+    # Everything a list view needs; leaves out the file BLOB and the notes
+    SUMMARY_COLUMNS: ClassVar[tuple] = ("id", "name", "type", "version", "file_type", 
+                                        "file_size", "content_hash", "created_at")
     
     def __init__(self, id=None, name="", type="", version="1.0", file_content=None, file_type="", 
-                 notes="", created_at=None, updated_at=None, **kwargs):
+                 notes="", content_hash=None, file_size=None, created_at=None, updated_at=None, **kwargs):
         self.id = id
         self.name = name
         self.type = type
@@ -179,68 +590,178 @@ class Document(BaseModel):
         self.file_content = file_content
         self.file_type = file_type
         self.notes = notes
+        self.content_hash = content_hash
+        self.file_size = file_size
         self.created_at = created_at
         self.updated_at = updated_at
     
+    def set_content(self, data: bytes) -> None:
+        """Store new file content through the active storage backend"""
+        self.content_hash = hash_content(data)
+        self.file_size = len(data)
+        get_storage().store(self, data)
+    
+    def import_file(self, path: str, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Save the record with the file at `path` as its content
+        
+        The file is streamed in fixed-size chunks, so memory use stays flat
+        regardless of its size. `progress(done, total)` reports bytes copied.
+        Content the record held before is released once the new one is saved.
+        """
+        previous_hash = self.content_hash if self.id else None
+        get_storage().import_file(self, path, progress)
+        if previous_hash and previous_hash != self.content_hash:
+            release_content(previous_hash)
+        return self.id
+    
+    def export_to(self, target, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """Stream the file content into the writable binary file object `target`"""
+        return export_content(self, target, progress)
+    
+    def open_content(self):
+        """Context manager yielding the file content as a read-only buffer (or None)"""
+        return open_content(self)
+    
+    def content_path(self) -> Optional[str]:
+        """Return the path of the file holding the content, or None if it is stored in the database"""
+        return content_path(self)
+    
+    def get_content(self) -> Optional[bytes]:
+        """Return the file content as bytes"""
+        with self.open_content() as content:
+            return bytes(content) if content is not None else None
+    
+    @classmethod
+    def delete_many(cls, objects_or_ids: Sequence[Any]) -> int:
+        """Delete many documents in one transaction and release their unused content"""
+        ids = [getattr(item, 'id', item) for item in objects_or_ids]
+        if not ids:
+            return 0
+        placeholders = ", ".join(["?"] * len(ids))
+        cursor = get_connection().cursor()
+        cursor.execute(
+            f"SELECT DISTINCT content_hash FROM documents WHERE id IN ({placeholders}) AND content_hash IS NOT NULL",
+            ids
+        )
+        hashes = [row[0] for row in cursor.fetchall()]
+        
+        deleted = super().delete_many(ids)
+        for content_hash in hashes:
+            release_content(content_hash)
+        return deleted
+    
+    def delete(self) -> bool:
+        """Delete the record and release its stored content if nothing else uses it"""
+        content_hash = self.content_hash if self.id else None
+        deleted = super().delete()
+        if deleted and content_hash:
+            release_content(content_hash)
+        return deleted
+    
     @classmethod
-    def find_related(cls, related_type: str, related_id: int) -> List['Document']:
+    def find_related(cls, related_type: str, related_id: int,
+                     columns: Optional[Sequence[str]] = None) -> List['Document']:
         """Find all documents linked to a specific contact or application"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        cursor = get_connection().cursor()
         
-        cursor.execute('''
-            SELECT d.* FROM documents d
+        cursor.execute(f'''
+            SELECT {cls._select_list(columns, "d")} FROM documents d
             JOIN document_usage du ON d.id = du.document_id
             WHERE du.related_type = ? AND du.related_id = ?
         ''', (related_type, related_id))
         
-        rows = cursor.fetchall()
+        return cls._fetch_all(cursor)
+    
+    def find_linked_ids(self, related_type: str) -> List[int]:
+        """Get the IDs of all contacts or applications this document is linked to"""
+        cursor = get_connection().cursor()
         
-        result = []
-        if rows:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                data = {columns[i]: row[i] for i in range(len(columns))}
-                result.append(cls(**data))
+        cursor.execute('''
+            SELECT related_id FROM document_usage
+            WHERE document_id = ? AND related_type = ?
+        ''', (self.id, related_type))
         
-        conn.close()
-        return result
+        return [row[0] for row in cursor.fetchall()]
     
     def link_to(self, related_type: str, related_id: int) -> bool:
         """Link this document to a contact or application"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id FROM document_usage 
-            WHERE document_id = ? AND related_type = ? AND related_id = ?
-        ''', (self.id, related_type, related_id))
-        
-        if cursor.fetchone():
-            conn.close()
-            return False 
-        
-        cursor.execute('''
-            INSERT INTO document_usage (document_id, related_type, related_id)
-            VALUES (?, ?, ?)
-        ''', (self.id, related_type, related_id))
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id FROM document_usage 
+                WHERE document_id = ? AND related_type = ? AND related_id = ?
+            ''', (self.id, related_type, related_id))
+            
+            if cursor.fetchone():
+                return False 
+            
+            cursor.execute('''
+                INSERT INTO document_usage (document_id, related_type, related_id)
+                VALUES (?, ?, ?)
+            ''', (self.id, related_type, related_id))
         
-        conn.commit()
-        conn.close()
         return True
     
     def unlink_from(self, related_type: str, related_id: int) -> bool:
         """Remove link between this document and a contact or application"""
-        conn = get_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            conn.execute('''
+                DELETE FROM document_usage 
+                WHERE document_id = ? AND related_type = ? AND related_id = ?
+            ''', (self.id, related_type, related_id))
         
-        cursor.execute('''
-            DELETE FROM document_usage 
-            WHERE document_id = ? AND related_type = ? AND related_id = ?
-        ''', (self.id, related_type, related_id))
+        return True
+    
+    @classmethod
+    def link_many(cls, links: Sequence[tuple]) -> None:
+        """
+        Create many document links in one transaction
+        
+        `links` holds (document_id, related_type, related_id) tuples; links
+        that already exist are skipped.
+        """
+        with transaction() as conn:
+            conn.executemany('''
+                INSERT INTO document_usage (document_id, related_type, related_id)
+                SELECT ?1, ?2, ?3
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM document_usage
+                    WHERE document_id = ?1 AND related_type = ?2 AND related_id = ?3
+                )
+            ''', links)
+    
+    @classmethod
+    def unlink_many(cls, links: Sequence[tuple]) -> None:
+        """Remove many (document_id, related_type, related_id) links in one transaction"""
+        with transaction() as conn:
+            conn.executemany('''
+                DELETE FROM document_usage 
+                WHERE document_id = ? AND related_type = ? AND related_id = ?
+            ''', links)
+    
+    @classmethod
+    def update_links(cls, links: Sequence[tuple], unlinks: Sequence[tuple]) -> None:
+        """Create `links` and remove `unlinks` (see link_many) in one transaction"""
+        with transaction():
+            cls.link_many(links)
+            cls.unlink_many(unlinks)
+    
+    def replace_links(self, related_type: str, related_ids: Sequence[int]) -> None:
+        """Link this document to exactly `related_ids` of `related_type`, in one transaction"""
+        with transaction():
+            self.unlink_all_from(related_type)
+            self.link_many([(self.id, related_type, related_id) for related_id in related_ids])
+    
+    def unlink_all_from(self, related_type: str) -> bool:
+        """Remove all links between this document and contacts or applications"""
+        with transaction() as conn:
+            conn.execute('''
+                DELETE FROM document_usage 
+                WHERE document_id = ? AND related_type = ?
+            ''', (self.id, related_type))
         
-        conn.commit()
-        conn.close()
         return True
 
 
@@ -248,6 +769,9 @@ class Reminder(BaseModel):
     """Model for reminders"""
     table_name = "reminders"
     
+    # due_date is stored as ISO-8601 (YYYY-MM-DD) so it sorts and indexes as text
+    DATE_FORMAT: ClassVar[str] = "%Y-%m-%d"
+    
     def __init__(self, id=None, title="", related_type="", related_id=None, 
                  description="", due_date="", status="pending", created_at=None, updated_at=None, **kwargs):
         self.id = id
@@ -265,41 +789,76 @@ class Reminder(BaseModel):
         """Find all reminders for a specific contact or application"""
         return cls.find_all("related_type = ? AND related_id = ?", (related_type, related_id))
     
+    @staticmethod
+    def to_date_string(value) -> str:
+        """Convert a date, datetime or ISO string to the stored due_date form"""
+        if isinstance(value, datetime):
+            value = value.date()
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+    
     @classmethod
-    def find_upcoming(cls, days: int = 7) -> List['Reminder']:
-        """Find reminders due within the specified number of days"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def query(cls, status: Optional[str] = None, due_from=None, due_to=None) -> List['Reminder']:
+        """
+        Find reminders by status and due date range in a single joined query
         
-        today = datetime.now().strftime("%m/%d/%Y")
+        Every reminder comes back with a `related_name` attribute naming its
+        contact or application, so callers never look those up one by one.
+        Any filter left as None is not applied.
+        """
+        conditions = []
+        params = []
         
-        cursor.execute('''
+        if status:
+            conditions.append("r.status = ?")
+            params.append(status)
+        if due_from is not None:
+            conditions.append("r.due_date >= ?")
+            params.append(cls.to_date_string(due_from))
+        if due_to is not None:
+            conditions.append("r.due_date <= ?")
+            params.append(cls.to_date_string(due_to))
+        
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        cursor = get_connection().cursor()
+        cursor.execute(f'''
             SELECT r.*, 
-                   CASE 
-                       WHEN r.related_type = 'contact' THEN o.name
+                   COALESCE(CASE 
+                       WHEN r.related_type = 'contact' THEN o.name || COALESCE(' at ' || NULLIF(o.company, ''), '')
                        WHEN r.related_type = 'application' THEN a.title || ' at ' || a.name
-                       ELSE 'Unknown'
-                   END as related_name
+                   END, '') as related_name
             FROM reminders r
             LEFT JOIN outreaches o ON r.related_id = o.id AND r.related_type = 'contact'
             LEFT JOIN applications a ON r.related_id = a.id AND r.related_type = 'application'
-            WHERE r.status = 'pending'
-            AND julianday(r.due_date) - julianday(?) <= ?
-        ''', (today, days))
-        
-        rows = cursor.fetchall()
-        
-        result = []
-        if rows:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                data = {columns[i]: row[i] for i in range(len(columns)) if i < len(columns) - 1}
-                reminder = cls(**data)
-                reminder.related_name = row[len(columns) - 1]
-                result.append(reminder)
+            {where_clause}
+            ORDER BY r.due_date, r.id
+        ''', params)
         
-        conn.close()
-        return result
+        return cls._fetch_all(cursor)
+    
+    @classmethod
+    def find_due_between(cls, start, end, status: Optional[str] = None) -> List['Reminder']:
+        """Find reminders due between two dates (inclusive), optionally with a given status"""
+        return cls.query(status, due_from=start, due_to=end)
+    
+    @classmethod
+    def find_due_by(cls, day, status: str = "pending") -> List['Reminder']:
+        """Find reminders with the given status due on or before `day`, overdue ones included"""
+        return cls.query(status, due_to=day)
+    
+    @classmethod
+    def find_upcoming(cls, days: int = 7) -> List['Reminder']:
+        """Find pending reminders due within the specified number of days, overdue ones included"""
+        return cls.query("pending", due_to=date.today() + timedelta(days=days))
+    
+    def due_on(self) -> Optional[date]:
+        """Return the due date as a date object, or None if it can't be parsed"""
+        try:
+            return datetime.strptime(self.due_date, self.DATE_FORMAT).date()
+        except (TypeError, ValueError):
+            return None
     
     def mark_complete(self) -> bool:
         """Mark this reminder as completed"""
@@ -308,9 +867,17 @@ class Reminder(BaseModel):
         self.save()
         return True
     
-    def snooze(self, new_date: str) -> bool:
+    @classmethod
+    def snooze_many(cls, reminders: Sequence['Reminder'], new_date) -> None:
+        """Snooze several reminders to the same date in one transaction"""
+        for reminder in reminders:
+            reminder.due_date = cls.to_date_string(new_date)
+            reminder.status = "snoozed"
+        cls.save_many(reminders)
+    
+    def snooze(self, new_date) -> bool:
         """Snooze this reminder to a new date"""
-        self.due_date = new_date
+        self.due_date = self.to_date_string(new_date)
         self.status = "snoozed"
         self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.save()
@@ -320,6 +887,7 @@ class Reminder(BaseModel):
 class MessageTemplate(BaseModel):
     """Model for message templates"""
     table_name = "message_templates"
+    search_columns = ("name", "content")
     
     def __init__(self, id=None, name="", category="", content="", 
                  created_at=None, updated_at=None, **kwargs):
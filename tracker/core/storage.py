@@ -0,0 +1,357 @@
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+
+from tracker.core.database import get_connection, transaction
+
+STORAGE_DIR = os.path.join(os.path.expanduser("~"), ".outreach_tracker", "blobs")
+CHUNK_SIZE = 1024 * 1024
+BLOBS_MIGRATED_KEY = "document_blobs_migrated"
+
+def hash_content(data) -> str:
+    """Return the SHA-256 hex digest used to address a file's content"""
+    return hashlib.sha256(data).hexdigest()
+
+def copy_stream(source, target, total, progress=None, hasher=None) -> int:
+    """
+    Copy `source` to `target` in CHUNK_SIZE pieces
+    
+    `progress(done, total)` is called after every chunk and `hasher` is fed
+    the bytes as they pass. Returns the number of bytes copied.
+    """
+    done = 0
+    if progress:
+        progress(done, total)
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        if hasher is not None:
+            hasher.update(chunk)
+        target.write(chunk)
+        done += len(chunk)
+        if progress:
+            progress(done, total)
+    return done
+
+def _update_content_row(conn, document) -> None:
+    conn.execute(
+        "UPDATE documents SET content_hash = ?, file_size = ? WHERE id = ?",
+        (document.content_hash, document.file_size, document.id)
+    )
+
+def export_from_database(document, target, progress=None) -> int:
+    """Stream a BLOB stored in the documents table into the file object `target`"""
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT length(file_content) FROM documents WHERE id = ?", (document.id,)
+    ).fetchone()
+    if not row or row[0] is None:
+        return 0
+
+    if not hasattr(conn, "blobopen"):
+        # Python < 3.11 has no incremental BLOB I/O
+        data = document.file_content or b""
+        target.write(data)
+        if progress:
+            progress(len(data), len(data))
+        return len(data)
+
+    with conn.blobopen("documents", "file_content", document.id, readonly=True) as blob:
+        return copy_stream(blob, target, row[0], progress)
+
+class DocumentStorage:
+    """Where document file contents are kept"""
+    name = ""
+
+    def store(self, document, data) -> None:
+        """Persist `data` as the content of `document` (before it is saved)"""
+        raise NotImplementedError
+
+    def open(self, document):
+        """Context manager yielding a read-only buffer with the content, or None"""
+        raise NotImplementedError
+
+    def store_file(self, conn, document, path: str, progress=None) -> None:
+        """Stream the file at `path` in as the content of the saved `document`"""
+        raise NotImplementedError
+
+    def import_file(self, document, path: str, progress=None) -> None:
+        """Save `document` with the file at `path` as its content"""
+        with transaction() as conn:
+            document.file_content = None
+            document.save()
+            self.store_file(conn, document, path, progress)
+
+    def export(self, document, target, progress=None) -> int:
+        """Stream the document's content into the file object `target`"""
+        raise NotImplementedError
+
+    def release(self, content_hash: str) -> None:
+        """Called after a document is deleted so unused content can be dropped"""
+
+
+class DatabaseStorage(DocumentStorage):
+    """Legacy mode: file contents live in the documents.file_content BLOB column"""
+    name = "database"
+
+    def store(self, document, data) -> None:
+        document.file_content = bytes(data)
+
+    @contextmanager
+    def open(self, document):
+        yield document.file_content
+
+    def store_file(self, conn, document, path: str, progress=None) -> None:
+        size = os.path.getsize(path)
+        hasher = hashlib.sha256()
+
+        with open(path, "rb") as source:
+            if hasattr(conn, "blobopen"):
+                # Reserve the space, then fill it in place chunk by chunk
+                conn.execute(
+                    "UPDATE documents SET file_content = zeroblob(?) WHERE id = ?", (size, document.id)
+                )
+                with conn.blobopen("documents", "file_content", document.id) as blob:
+                    copy_stream(source, blob, size, progress, hasher)
+            else:
+                data = source.read()
+                hasher.update(data)
+                conn.execute("UPDATE documents SET file_content = ? WHERE id = ?", (data, document.id))
+                if progress:
+                    progress(size, size)
+
+        document.content_hash = hasher.hexdigest()
+        document.file_size = size
+        _update_content_row(conn, document)
+        document.defer("file_content")
+
+    def export(self, document, target, progress=None) -> int:
+        return export_from_database(document, target, progress)
+
+
+class ContentAddressedStorage(DocumentStorage):
+    """
+    Keeps file contents outside the database, one file per SHA-256 digest
+
+    Identical uploads share a single file. Files are written to a temporary
+    name and renamed into place, so a crash never leaves a partial blob
+    under a valid digest.
+    """
+    name = "file"
+
+    def __init__(self, root: str = STORAGE_DIR):
+        self.root = root
+
+    def path_for(self, content_hash: str) -> str:
+        return os.path.join(self.root, content_hash[:2], content_hash)
+
+    def exists(self, content_hash: str) -> bool:
+        return bool(content_hash) and os.path.exists(self.path_for(content_hash))
+
+    def put(self, data) -> str:
+        """Write `data` to the store if it isn't there yet and return its digest"""
+        content_hash = hash_content(data)
+        path = self.path_for(content_hash)
+        if os.path.exists(path):
+            return content_hash
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return content_hash
+
+    @contextmanager
+    def read(self, content_hash: str):
+        """Yield the stored content as a read-only memory map"""
+        with open(self.path_for(content_hash), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses zero-length files
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def store(self, document, data) -> None:
+        self.put(data)
+        document.file_content = None
+
+    def put_file(self, path: str, progress=None) -> tuple:
+        """Stream the file at `path` into the store and return its (digest, size)"""
+        size = os.path.getsize(path)
+        hasher = hashlib.sha256()
+
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with open(path, "rb") as source, os.fdopen(fd, "wb") as target:
+                copy_stream(source, target, size, progress, hasher)
+                target.flush()
+                os.fsync(target.fileno())
+
+            content_hash = hasher.hexdigest()
+            final_path = self.path_for(content_hash)
+            if os.path.exists(final_path):
+                os.unlink(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return content_hash, size
+
+    def store_file(self, conn, document, path: str, progress=None) -> None:
+        document.content_hash, document.file_size = self.put_file(path, progress)
+        document.file_content = None
+        _update_content_row(conn, document)
+
+    def import_file(self, document, path: str, progress=None) -> None:
+        # Copy the file in before touching the database, so the write lock
+        # is only held for the row itself and not for the whole upload
+        document.content_hash, document.file_size = self.put_file(path, progress)
+        document.file_content = None
+        try:
+            document.save()
+        except BaseException:
+            self.release(document.content_hash)
+            raise
+
+    def export(self, document, target, progress=None) -> int:
+        if not self.exists(document.content_hash):
+            return export_from_database(document, target, progress)
+
+        path = self.path_for(document.content_hash)
+        with open(path, "rb") as source:
+            return copy_stream(source, target, os.path.getsize(path), progress)
+
+    @contextmanager
+    def open(self, document):
+        if self.exists(document.content_hash):
+            with self.read(document.content_hash) as content:
+                yield content
+        else:
+            # Rows written before the blob store existed, or in database mode
+            yield document.file_content
+
+    def release(self, content_hash: str) -> None:
+        if not content_hash:
+            return
+
+        cursor = get_connection().cursor()
+        cursor.execute("SELECT 1 FROM documents WHERE content_hash = ? LIMIT 1", (content_hash,))
+        if cursor.fetchone():
+            return
+
+        try:
+            os.unlink(self.path_for(content_hash))
+        except FileNotFoundError:
+            pass
+
+
+_blob_store = ContentAddressedStorage()
+_storage = None
+
+def get_storage() -> DocumentStorage:
+    """Return the active storage backend, falling back to the database if needed"""
+    global _storage
+    if _storage is None:
+        try:
+            os.makedirs(_blob_store.root, exist_ok=True)
+            _storage = _blob_store
+        except OSError:
+            _storage = DatabaseStorage()
+    return _storage
+
+def set_storage(storage: DocumentStorage) -> None:
+    """Select the backend new document content is written to"""
+    global _storage, _blob_store
+    _storage = storage
+    if isinstance(storage, ContentAddressedStorage):
+        _blob_store = storage
+
+@contextmanager
+def open_content(document):
+    """
+    Yield the content of `document` from wherever it is stored
+
+    Content-addressed files are read regardless of the active backend, so
+    switching back to database mode never hides existing documents.
+    """
+    with _blob_store.open(document) as content:
+        yield content
+
+def content_path(document):
+    """Return the path of the file holding the content of `document`, or None if it is in the database"""
+    if _blob_store.exists(document.content_hash):
+        return _blob_store.path_for(document.content_hash)
+    return None
+
+def export_content(document, target, progress=None) -> int:
+    """Stream the content of `document` into `target` from wherever it is stored"""
+    return _blob_store.export(document, target, progress)
+
+def release_content(content_hash: str) -> None:
+    """Drop stored content that no document references any more"""
+    _blob_store.release(content_hash)
+
+def migrate_document_blobs() -> int:
+    """
+    Move BLOBs still stored in the documents table into the active backend
+
+    Also fills in content_hash and file_size for older rows. Returns the
+    number of documents that were updated. Once a sweep finds nothing left
+    to do it is recorded in app_state, and later calls return straight
+    away until a document is written with in-database content again.
+    """
+    storage = get_storage()
+    cursor = get_connection().cursor()
+    cursor.execute("SELECT value FROM app_state WHERE key = ?", (BLOBS_MIGRATED_KEY,))
+    row = cursor.fetchone()
+    if row and row[0] == storage.name:
+        return 0
+
+    if storage.name == "file":
+        pending = "file_content IS NOT NULL"
+    else:
+        pending = "file_content IS NOT NULL AND content_hash IS NULL"
+    cursor.execute(f"SELECT id FROM documents WHERE {pending}")
+    doc_ids = [row[0] for row in cursor.fetchall()]
+
+    for doc_id in doc_ids:
+        with transaction() as conn:
+            row = conn.execute("SELECT file_content FROM documents WHERE id = ?", (doc_id,)).fetchone()
+            data = row[0]
+            if storage.name == "file":
+                content_hash = _blob_store.put(data)
+                conn.execute(
+                    "UPDATE documents SET content_hash = ?, file_size = ?, file_content = NULL WHERE id = ?",
+                    (content_hash, len(data), doc_id)
+                )
+            else:
+                conn.execute(
+                    "UPDATE documents SET content_hash = ?, file_size = ? WHERE id = ?",
+                    (hash_content(data), len(data), doc_id)
+                )
+
+    with transaction() as conn:
+        # Only mark the sweep done if nothing was written in the meantime
+        conn.execute(
+            f"INSERT OR REPLACE INTO app_state (key, value) SELECT ?, ? "
+            f"WHERE NOT EXISTS (SELECT 1 FROM documents WHERE {pending})",
+            (BLOBS_MIGRATED_KEY, storage.name)
+        )
+    return len(doc_ids)
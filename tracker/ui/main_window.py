@@ -1,10 +1,20 @@
+import pstats
+import time
+
+# Startup is timed from here, before the heavier imports below
+IMPORT_STARTED = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk
-from tracker.core.database import create_tables
-from tracker.ui.tabs.contacts_tab import build_contacts_tab
-from tracker.ui.tabs.applications_tab import build_applications_tab
-from tracker.ui.tabs.reminders_tab import build_reminders_tab
-from tracker.ui.tabs.resources_tab import build_resources_tab
+from tracker.core.database import create_tables, close_connections
+from tracker.core.executor import shutdown as shutdown_executor, submit
+from tracker.core.storage import migrate_document_blobs
+from tracker.utils.ui_components import LazyTabs
+
+# The due-reminders check builds the reminders tab, so it waits until the
+# window is up
+REMINDER_CHECK_DELAY_MS = 500
+PROFILE_LINES = 25
 
 STATUS_OPTIONS = [
     "🔵 Not Connected", 
@@ -31,8 +41,49 @@ APPLICATION_STATUS_OPTIONS = [
     "💼 Accepted"
 ]
 
-def run_gui():
+class StartupTimer:
+    """Records how long each phase of startup takes, for --startup-report"""
+    
+    def __init__(self, started=IMPORT_STARTED):
+        self.started = started
+        self.last = started
+        self.phases = []
+    
+    def mark(self, label):
+        """End the current phase, naming it `label`"""
+        now = time.perf_counter()
+        self.phases.append((label, now - self.last))
+        self.last = now
+    
+    def report(self) -> str:
+        lines = ["Startup timings (ms):"]
+        elapsed = 0.0
+        for label, seconds in self.phases:
+            elapsed += seconds
+            lines.append(f"  {label:<24}{seconds * 1000:>9.1f}{elapsed * 1000:>9.1f}")
+        lines.append(f"  {'total':<24}{elapsed * 1000:>18.1f}")
+        return "\n".join(lines)
+
+def run_gui(startup_report=False, profiler=None):
+    """
+    Open the main window
+    
+    Only the contacts tab is built before the window appears; the others
+    are built the first time they are selected. With `startup_report` the
+    time taken by each startup phase is printed once the window is painted
+    and the first contacts are on screen.
+    
+    `profiler` is an enabled cProfile.Profile for --profile-startup. It is
+    stopped at the same point, the report and the most expensive calls are
+    printed, and the window closes.
+    """
+    timer = StartupTimer()
+    timer.mark("imports")
     create_tables()
+    timer.mark("schema")
+    # Legacy BLOBs are rare; move them on the database worker instead of
+    # scanning the documents table before the window can open
+    submit(migrate_document_blobs)
 
     root = tk.Tk()
     root.title("Outreach And Application Tracker")
@@ -41,22 +92,76 @@ def run_gui():
     notebook = ttk.Notebook(root)
     notebook.pack(fill="both", expand=True)
     
-    contacts_tab = ttk.Frame(notebook)
-    applications_tab = ttk.Frame(notebook)
-    reminders_tab = ttk.Frame(notebook)
-    resources_tab = ttk.Frame(notebook)
+    startup_report = startup_report or profiler is not None
+    timer.mark("window")
+    
+    def tab_built(text, seconds):
+        if startup_report:
+            print(f"{text} tab built in {seconds * 1000:.1f} ms")
+    
+    tabs = LazyTabs(notebook, on_build=tab_built)
+    check_due_reminders = None
+    
+    def build_contacts(frame):
+        from tracker.ui.tabs.contacts_tab import build_contacts_tab
+        build_contacts_tab(frame, STATUS_OPTIONS, check_reminders)
+    
+    def build_applications(frame):
+        from tracker.ui.tabs.applications_tab import build_applications_tab
+        build_applications_tab(frame, APPLICATION_STATUS_OPTIONS, check_reminders)
+    
+    def build_reminders(frame):
+        nonlocal check_due_reminders
+        from tracker.ui.tabs.reminders_tab import build_reminders_tab
+        check_due_reminders = build_reminders_tab(frame, notebook)
+    
+    def build_resources(frame):
+        from tracker.ui.tabs.resources_tab import build_resources_tab
+        build_resources_tab(frame)
+    
+    def check_reminders():
+        """Check for due reminders, building the reminders tab first if needed"""
+        tabs.ensure_built(reminders_tab)
+        check_due_reminders()
+    
+    contacts_tab = tabs.add("💬 Contacts", build_contacts)
+    tabs.add("📑 Applications", build_applications)
+    reminders_tab = tabs.add("🔔 Reminders", build_reminders)
+    tabs.add("📁 Resources", build_resources)
+    
+    tabs.ensure_built(contacts_tab)
+    timer.mark("contacts tab")
     
-    notebook.add(contacts_tab, text="💬 Contacts")
-    notebook.add(applications_tab, text="📑 Applications")
-    notebook.add(reminders_tab, text="🔔 Reminders")
-    notebook.add(resources_tab, text="📁 Resources")
+    waiting = {"first paint", "first data load"}
     
-    check_reminders = build_reminders_tab(reminders_tab, notebook)
+    def reached(label):
+        """Mark a startup milestone; report once both have been reached"""
+        if label not in waiting:
+            return
+        waiting.discard(label)
+        timer.mark(label)
+        if waiting:
+            return
+        if startup_report:
+            print(timer.report())
+        if profiler is not None:
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            root.destroy()
     
-    build_contacts_tab(contacts_tab, STATUS_OPTIONS, check_reminders)
-    build_applications_tab(applications_tab, APPLICATION_STATUS_OPTIONS, check_reminders)
-    build_resources_tab(resources_tab)
+    def on_map(event):
+        if event.widget is root:
+            root.unbind("<Map>")
+            root.after_idle(lambda: reached("first paint"))
+            root.after(REMINDER_CHECK_DELAY_MS, check_reminders)
     
-    check_reminders()
+    root.bind("<Map>", on_map)
+    # Generated by the contacts tree (bound here through its toplevel bindtag)
+    root.bind("<<ProviderChanged>>", lambda e: reached("first data load"))
     
-    root.mainloop()
\ No newline at end of file
+    try:
+        root.mainloop()
+    finally:
+        # Let a running job finish before its connection is closed
+        shutdown_executor()
+        close_connections()
@@ -6,8 +6,9 @@ from tkcalendar import DateEntry
 import os
 
 from tracker.core.models import Application, Document, Reminder
-from tracker.utils.ui_components import (create_search_frame, create_sortable_treeview, 
-                                      truncate_text, format_date, resize_treeview_columns)
+from tracker.utils.ui_components import (create_search_frame, create_sortable_treeview, ListRowProvider,
+                                      QueryRowProvider, truncate_text, format_date, resize_treeview_columns,
+                                      BackgroundTask, LoadingIndicator, run_in_background)
 from tracker.utils.reminder_utils import create_reminder, set_reminder_for_item
 from tracker.utils.document_utils import (manage_linked_documents, view_linked_documents,
                                       unlink_document, open_document, view_document_details)
@@ -18,7 +19,8 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
     search_frame, search_var = create_search_frame(
         parent,
         search_callback=lambda: refresh_tree(search_var.get(), filter_status_var.get()),
-        reset_callback=lambda: (search_var.set(""), filter_status_var.set("All"), refresh_tree())
+        reset_callback=lambda: (search_var.set(""), filter_status_var.set("All"), refresh_tree()),
+        live_search=True
     )
     
     tk.Label(search_frame, text="Filter by Status:").pack(side="left", padx=(20, 5))
@@ -91,31 +93,21 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
             close_button = tk.Button(popup, text="Close", command=popup.destroy)
             close_button.pack(pady=10)
 
+    refresh_task = BackgroundTask(tree, LoadingIndicator(search_frame))
+    edit_task = BackgroundTask(parent)
+    
     def refresh_tree(search_text="", status_filter="All"):
-        """Refresh the treeview with filtered data"""
-        for row in tree.get_children():
-            tree.delete(row)
-        
-        full_notes.clear()
-        
+        """Refresh the treeview with filtered data, querying on the database worker"""
         where_clause = []
         params = []
         
-        if search_text:
-            where_clause.append("""
-                (title LIKE ? OR name LIKE ? OR application_link LIKE ? OR notes LIKE ?)
-            """)
-            search_param = f"%{search_text}%"
-            params.extend([search_param, search_param, search_param, search_param])
-        
         if status_filter != "All":
             where_clause.append("status = ?")
             params.append(status_filter)
         
         final_where = " AND ".join(where_clause) if where_clause else ""
         
-        applications = Application.find_all(final_where, tuple(params))
-        
+        order_by = None
         if sort_column and sort_direction:
             column_map = {
                 "Title": "title",
@@ -126,26 +118,37 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
                 "Notes": "notes"
             }
             
-            attr = column_map.get(sort_column)
-            if attr:
-                reverse = sort_direction == "desc"
-                applications = sorted(applications, 
-                                    key=lambda a: getattr(a, attr, "") or "", 
-                                    reverse=reverse)
-        
-        for app in applications:
+            order_by = column_map.get(sort_column)
+        descending = sort_direction == "desc"
+        
+        def to_row(app):
             rid = str(app.id)
             note_text = app.notes or ""
             full_notes[rid] = note_text
             
-            tree.insert("", "end", iid=rid, values=(
+            return rid, (
                 app.title,
                 app.name,
                 app.application_link,
                 app.status,
                 app.updated_at or "",
                 truncate_text(note_text)
-            ))
+            )
+        
+        def load():
+            if search_text.strip():
+                applications = Application.search(search_text, final_where, tuple(params),
+                                                  order_by=order_by, descending=descending)
+                return ListRowProvider(applications, to_row)
+            # Sorted pages are read from the index as they scroll into view
+            return QueryRowProvider(Application, to_row, final_where, tuple(params),
+                                    order_by=order_by, descending=descending).prefetch()
+        
+        def show(provider):
+            full_notes.clear()
+            tree.set_provider(provider)
+        
+        refresh_task.run(load, show)
     
     def show_context_menu(event):
         item_id = tree.identify_row(event.y)
@@ -190,11 +193,16 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
     def delete_application(item_id):
         confirm = messagebox.askyesno("Delete", "Are you sure you want to delete this application?")
         if confirm:
-            application = Application.get_by_id(item_id)
-            if application:
-                application.delete()
+            def delete():
+                application = Application.get_by_id(item_id)
+                if application:
+                    application.delete()
+            
+            def deleted(result):
                 refresh_tree(search_var.get(), filter_status_var.get())
                 reset_form()
+            
+            run_in_background(tree, delete, deleted)
     
     def on_tree_click(event):
         item_id = tree.identify_row(event.y)
@@ -206,7 +214,7 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
     
     tree.bind("<ButtonRelease-1>", on_tree_click)
     
-    tree.bind("<ButtonPress-1>", lambda event: resize_treeview_columns(tree, event))
+    tree.bind("<Double-1>", lambda event: resize_treeview_columns(tree, event))
     
     def on_double_click(event):
         item_id = tree.identify_row(event.y)
@@ -219,7 +227,7 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
         if column_index == 5:
             view_full_note(item_id)
     
-    tree.bind("<Double-1>", on_double_click)
+    tree.bind("<Double-1>", on_double_click, add="+")
     
     def on_frame_click(event):
         if not tree.identify_row(event.y):
@@ -265,6 +273,7 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
     def reset_form():
         nonlocal editing_id
         editing_id = None
+        edit_task.cancel()
         entry_title.delete(0, tk.END)
         entry_company.delete(0, tk.END)
         entry_application_link.delete(0, tk.END)
@@ -298,50 +307,60 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
             notes=notes
         )
         
-        application.save()
-        
-        is_new = editing_id is None
-        if is_new:
-            editing_id = application.id
-        
-        messagebox.showinfo("Success", 
-                          "Application updated successfully!" if not is_new else "Application added successfully!")
-        
-        if is_new and status in ["✅ Applied", "🔍 Under Review"]:
-            if messagebox.askyesno("Create Reminder", "Would you like to set a follow-up reminder for this application?"):
-                set_reminder_for_item(editing_id, 'application', parent, check_reminders_callback)
+        def saved(result):
+            nonlocal editing_id
+            add_button.config(state="normal")
+            is_new = editing_id is None
+            if is_new:
+                editing_id = application.id
+            
+            messagebox.showinfo("Success", 
+                              "Application updated successfully!" if not is_new else "Application added successfully!")
             
-            if messagebox.askyesno("Link Documents", "Would you like to link documents to this application?"):
-                manage_linked_documents(editing_id, 'application', parent)
+            if is_new and status in ["✅ Applied", "🔍 Under Review"]:
+                if messagebox.askyesno("Create Reminder", "Would you like to set a follow-up reminder for this application?"):
+                    set_reminder_for_item(editing_id, 'application', parent, check_reminders_callback)
+            
+                if messagebox.askyesno("Link Documents", "Would you like to link documents to this application?"):
+                    manage_linked_documents(editing_id, 'application', parent)
+            
+            reset_form()
+            refresh_tree(search_var.get(), filter_status_var.get())
         
-        reset_form()
-        refresh_tree(search_var.get(), filter_status_var.get())
+        def failed(error):
+            add_button.config(state="normal")
+            messagebox.showerror("Error", f"Failed to save application: {error}")
+        
+        add_button.config(state="disabled")
+        run_in_background(parent, application.save, saved, failed)
 
     def edit_application(item_id):
         nonlocal editing_id
         editing_id = item_id
         
-        application = Application.get_by_id(item_id)
-        if not application:
-            messagebox.showerror("Error", "Application not found")
-            return
-        
-        entry_title.delete(0, tk.END)
-        entry_title.insert(0, application.title)
-        
-        entry_company.delete(0, tk.END)
-        entry_company.insert(0, application.name)
-        
-        entry_application_link.delete(0, tk.END)
-        entry_application_link.insert(0, application.application_link or "")
-        
-        status_var.set(application.status)
-        
-        entry_notes.delete("1.0", tk.END)
-        if application.notes:
-            entry_notes.insert("1.0", application.notes)
+        def show(application):
+            if not application:
+                messagebox.showerror("Error", "Application not found")
+                return
+            
+            entry_title.delete(0, tk.END)
+            entry_title.insert(0, application.title)
+            
+            entry_company.delete(0, tk.END)
+            entry_company.insert(0, application.name)
+            
+            entry_application_link.delete(0, tk.END)
+            entry_application_link.insert(0, application.application_link or "")
+            
+            status_var.set(application.status)
+            
+            entry_notes.delete("1.0", tk.END)
+            if application.notes:
+                entry_notes.insert("1.0", application.notes)
+            
+            add_button.config(text="Update Application")
         
-        add_button.config(text="Update Application")
+        edit_task.run(lambda: Application.get_by_id(item_id), show)
     
     def set_reminder():
         if not editing_id:
@@ -372,6 +391,4 @@ def build_applications_tab(parent, status_options, check_reminders_callback=None
     cancel_button = tk.Button(button_frame, text="Cancel", command=reset_form)
     cancel_button.pack(side="left", padx=5)
 
-    search_var.trace("w", lambda *args: refresh_tree(search_var.get(), filter_status_var.get()))
-
     refresh_tree()
\ No newline at end of file
@@ -6,8 +6,9 @@ from tkcalendar import DateEntry
 import os
 
 from tracker.core.models import Contact, Document, Reminder
-from tracker.utils.ui_components import (create_search_frame, create_sortable_treeview, 
-                                      truncate_text, format_date, resize_treeview_columns)
+from tracker.utils.ui_components import (create_search_frame, create_sortable_treeview, ListRowProvider,
+                                      QueryRowProvider, truncate_text, format_date, resize_treeview_columns,
+                                      BackgroundTask, LoadingIndicator, run_in_background)
 from tracker.utils.reminder_utils import create_reminder, set_reminder_for_item
 from tracker.utils.document_utils import (manage_linked_documents, view_linked_documents,
                                       unlink_document, open_document, view_document_details)
@@ -18,7 +19,8 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
     search_frame, search_var = create_search_frame(
         parent,
         search_callback=lambda: refresh_tree(search_var.get(), filter_status_var.get()),
-        reset_callback=lambda: (search_var.set(""), filter_status_var.set("All"), refresh_tree())
+        reset_callback=lambda: (search_var.set(""), filter_status_var.set("All"), refresh_tree()),
+        live_search=True
     )
     
     tk.Label(search_frame, text="Filter by Status:").pack(side="left", padx=(20, 5))
@@ -91,32 +93,21 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
             close_button = tk.Button(popup, text="Close", command=popup.destroy)
             close_button.pack(pady=10)
 
+    refresh_task = BackgroundTask(tree, LoadingIndicator(search_frame))
+    edit_task = BackgroundTask(parent)
+    
     def refresh_tree(search_text="", status_filter="All"):
-        """Refresh the treeview with filtered data"""
-        for row in tree.get_children():
-            tree.delete(row)
-        
-        full_notes.clear()
-        
+        """Refresh the treeview with filtered data, querying on the database worker"""
         where_clause = []
         params = []
         
-        if search_text:
-            where_clause.append("""
-                (name LIKE ? OR company LIKE ? OR title LIKE ? OR email LIKE ? 
-                OR linkedin_url LIKE ? OR notes LIKE ?)
-            """)
-            search_param = f"%{search_text}%"
-            params.extend([search_param, search_param, search_param, search_param, search_param, search_param])
-        
         if status_filter != "All":
             where_clause.append("status = ?")
             params.append(status_filter)
         
         final_where = " AND ".join(where_clause) if where_clause else ""
         
-        contacts = Contact.find_all(final_where, tuple(params))
-        
+        order_by = None
         if sort_column and sort_direction:
             column_map = {
                 "Name": "name",
@@ -129,19 +120,15 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
                 "Notes": "notes"
             }
             
-            attr = column_map.get(sort_column)
-            if attr:
-                reverse = sort_direction == "desc"
-                contacts = sorted(contacts, 
-                                key=lambda c: getattr(c, attr, "") or "", 
-                                reverse=reverse)
-        
-        for contact in contacts:
+            order_by = column_map.get(sort_column)
+        descending = sort_direction == "desc"
+        
+        def to_row(contact):
             rid = str(contact.id)
             note_text = contact.notes or ""
             full_notes[rid] = note_text
             
-            tree.insert("", "end", iid=rid, values=(
+            return rid, (
                 contact.name,
                 contact.company,
                 contact.title,
@@ -150,7 +137,22 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
                 contact.status,
                 contact.last_response,
                 truncate_text(note_text)
-            ))
+            )
+        
+        def load():
+            if search_text.strip():
+                contacts = Contact.search(search_text, final_where, tuple(params),
+                                          order_by=order_by, descending=descending)
+                return ListRowProvider(contacts, to_row)
+            # Sorted pages are read from the index as they scroll into view
+            return QueryRowProvider(Contact, to_row, final_where, tuple(params),
+                                    order_by=order_by, descending=descending).prefetch()
+        
+        def show(provider):
+            full_notes.clear()
+            tree.set_provider(provider)
+        
+        refresh_task.run(load, show)
     
     def show_context_menu(event):
         item_id = tree.identify_row(event.y)
@@ -200,11 +202,16 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
     def delete_contact(item_id):
         confirm = messagebox.askyesno("Delete", "Are you sure you want to delete this contact?")
         if confirm:
-            contact = Contact.get_by_id(item_id)
-            if contact:
-                contact.delete()
+            def delete():
+                contact = Contact.get_by_id(item_id)
+                if contact:
+                    contact.delete()
+            
+            def deleted(result):
                 refresh_tree(search_var.get(), filter_status_var.get())
                 reset_form()
+            
+            run_in_background(tree, delete, deleted)
     
     def on_tree_click(event):
         item_id = tree.identify_row(event.y)
@@ -216,7 +223,7 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
     
     tree.bind("<ButtonRelease-1>", on_tree_click)
     
-    tree.bind("<ButtonPress-1>", lambda event: resize_treeview_columns(tree, event))
+    tree.bind("<Double-1>", lambda event: resize_treeview_columns(tree, event))
     
     def on_double_click(event):
         item_id = tree.identify_row(event.y)
@@ -229,7 +236,7 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
         if column_index == 7:
             view_full_note(item_id)
     
-    tree.bind("<Double-1>", on_double_click)
+    tree.bind("<Double-1>", on_double_click, add="+")
     
     def on_frame_click(event):
         if not tree.identify_row(event.y):
@@ -286,6 +293,7 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
     def reset_form():
         nonlocal editing_id
         editing_id = None
+        edit_task.cancel()
         entry_name.delete(0, tk.END)
         entry_company.delete(0, tk.END)
         entry_title.delete(0, tk.END)
@@ -335,66 +343,76 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
             notes=notes
         )
         
-        contact.save()
-        
-        is_new = editing_id is None
-        if is_new:
-            editing_id = contact.id
-        
-        messagebox.showinfo("Success", 
-                          "Contact updated successfully!" if not is_new else "Contact added successfully!")
-        
-        if is_new and status in ["✅ Connected", "💬 Messaged"]:
-            if messagebox.askyesno("Create Reminder", "Would you like to set a follow-up reminder for this contact?"):
-                set_reminder_for_item(editing_id, 'contact', parent, check_reminders_callback)
+        def saved(result):
+            nonlocal editing_id
+            add_button.config(state="normal")
+            is_new = editing_id is None
+            if is_new:
+                editing_id = contact.id
+            
+            messagebox.showinfo("Success", 
+                              "Contact updated successfully!" if not is_new else "Contact added successfully!")
             
-            if messagebox.askyesno("Link Documents", "Would you like to link documents to this contact?"):
-                manage_linked_documents(editing_id, 'contact', parent)
+            if is_new and status in ["✅ Connected", "💬 Messaged"]:
+                if messagebox.askyesno("Create Reminder", "Would you like to set a follow-up reminder for this contact?"):
+                    set_reminder_for_item(editing_id, 'contact', parent, check_reminders_callback)
+            
+                if messagebox.askyesno("Link Documents", "Would you like to link documents to this contact?"):
+                    manage_linked_documents(editing_id, 'contact', parent)
+            
+            reset_form()
+            refresh_tree(search_var.get(), filter_status_var.get())
         
-        reset_form()
-        refresh_tree(search_var.get(), filter_status_var.get())
+        def failed(error):
+            add_button.config(state="normal")
+            messagebox.showerror("Error", f"Failed to save contact: {error}")
+        
+        add_button.config(state="disabled")
+        run_in_background(parent, contact.save, saved, failed)
 
     def edit_contact(item_id):
         nonlocal editing_id
         editing_id = item_id
         
-        contact = Contact.get_by_id(item_id)
-        if not contact:
-            messagebox.showerror("Error", "Contact not found")
-            return
-        
-        entry_name.delete(0, tk.END)
-        entry_name.insert(0, contact.name)
-        
-        entry_company.delete(0, tk.END)
-        entry_company.insert(0, contact.company)
-        
-        entry_title.delete(0, tk.END)
-        entry_title.insert(0, contact.title or "")
-        
-        entry_email.delete(0, tk.END)
-        entry_email.insert(0, contact.email or "")
-        
-        entry_linkedin.delete(0, tk.END)
-        entry_linkedin.insert(0, contact.linkedin_url or "")
-        
-        status_var.set(contact.status)
-        
-        try:
-            date_str = contact.last_response
-            if date_str:
-                date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                entry_last_response.set_date(date_obj)
-            else:
+        def show(contact):
+            if not contact:
+                messagebox.showerror("Error", "Contact not found")
+                return
+            
+            entry_name.delete(0, tk.END)
+            entry_name.insert(0, contact.name)
+            
+            entry_company.delete(0, tk.END)
+            entry_company.insert(0, contact.company)
+            
+            entry_title.delete(0, tk.END)
+            entry_title.insert(0, contact.title or "")
+            
+            entry_email.delete(0, tk.END)
+            entry_email.insert(0, contact.email or "")
+            
+            entry_linkedin.delete(0, tk.END)
+            entry_linkedin.insert(0, contact.linkedin_url or "")
+            
+            status_var.set(contact.status)
+            
+            try:
+                date_str = contact.last_response
+                if date_str:
+                    date_obj = datetime.strptime(date_str, "%m/%d/%Y")
+                    entry_last_response.set_date(date_obj)
+                else:
+                    entry_last_response.set_date(datetime.now())
+            except ValueError:
                 entry_last_response.set_date(datetime.now())
-        except ValueError:
-            entry_last_response.set_date(datetime.now())
-        
-        entry_notes.delete("1.0", tk.END)
-        if contact.notes:
-            entry_notes.insert("1.0", contact.notes)
+            
+            entry_notes.delete("1.0", tk.END)
+            if contact.notes:
+                entry_notes.insert("1.0", contact.notes)
+            
+            add_button.config(text="Update Contact")
         
-        add_button.config(text="Update Contact")
+        edit_task.run(lambda: Contact.get_by_id(item_id), show)
 
     button_frame = tk.Frame(parent)
     button_frame.pack(pady=5)
@@ -418,6 +436,4 @@ def build_contacts_tab(parent, status_options, check_reminders_callback=None):
     cancel_button = tk.Button(button_frame, text="Cancel", command=reset_form)
     cancel_button.pack(side="left", padx=5)
 
-    search_var.trace("w", lambda *args: refresh_tree(search_var.get(), filter_status_var.get()))
-
     refresh_tree()
\ No newline at end of file
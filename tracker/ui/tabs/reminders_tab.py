@@ -1,11 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from tkcalendar import DateEntry
 import webbrowser
 import os
 
-from tracker.core.models import Reminder, Contact, Application
+from tracker.core.models import Reminder
+from tracker.utils.ui_components import (format_date, VirtualTreeview, ListRowProvider,
+                                      BackgroundTask, LoadingIndicator, run_in_background)
 
 def build_reminders_tab(parent, notebook):
     """
@@ -47,7 +49,7 @@ def build_reminders_tab(parent, notebook):
     refresh_btn.pack(side="right", padx=10)
     
     columns = ("Title", "Related To", "Description", "Due Date", "Status")
-    tree = ttk.Treeview(parent, columns=columns, show="headings", selectmode="browse")
+    tree = VirtualTreeview(parent, columns=columns, show="headings", selectmode="browse")
     
     for col in columns:
         tree.heading(col, text=col)
@@ -62,93 +64,59 @@ def build_reminders_tab(parent, notebook):
     tree.pack(side="left", fill="both", expand=True, padx=10, pady=5)
     scrollbar.pack(side="right", fill="y", pady=5)
     
+    tree.tag_configure("overdue", foreground="red")
+    
     reminder_data = {}
     
+    refresh_task = BackgroundTask(tree, LoadingIndicator(controls_frame))
+    check_task = BackgroundTask(parent)
+    
+    def load_reminders(status_filter, days_filter):
+        """Query the reminders matching the filters (runs on the database worker)"""
+        status = None if status_filter == "all" else status_filter
+        
+        if days_filter == "all":
+            return Reminder.query(status)
+        
+        days = int(days_filter)
+        
+        today = date.today()
+        future_date = today + timedelta(days=days)
+        
+        if status_filter == "pending":
+            return Reminder.find_upcoming(days)
+        return Reminder.find_due_between(today, future_date, status)
+    
     def refresh_reminders(status_filter="pending", days_filter="7"):
         """Refresh the reminders list based on filters"""
-        for item in tree.get_children():
-            tree.delete(item)
-            
+        refresh_task.run(lambda: load_reminders(status_filter, days_filter), show_reminders)
+    
+    def show_reminders(reminders):
         reminder_data.clear()
-        
-        if days_filter == "all":
-            reminders = []
-            
-            if status_filter == "all":
-                reminders = Reminder.find_all()
-            else:
-                reminders = Reminder.find_all("status = ?", (status_filter,))
-        else:
-            days = int(days_filter)
-            
-            if status_filter == "all":
-                today = datetime.now()
-                future_date = today + timedelta(days=days)
-                
-                today_str = today.strftime("%m/%d/%Y")
-                future_str = future_date.strftime("%m/%d/%Y")
-                
-                reminders = Reminder.find_all(
-                    "julianday(due_date) >= julianday(?) AND julianday(due_date) <= julianday(?)",
-                    (today_str, future_str)
-                )
-            elif status_filter == "pending":
-                reminders = Reminder.find_upcoming(days)
-            else:
-                today = datetime.now()
-                future_date = today + timedelta(days=days)
-                
-                today_str = today.strftime("%m/%d/%Y")
-                future_str = future_date.strftime("%m/%d/%Y")
-                
-                reminders = Reminder.find_all(
-                    "status = ? AND julianday(due_date) >= julianday(?) AND julianday(due_date) <= julianday(?)",
-                    (status_filter, today_str, future_str)
-                )
-                
         for reminder in reminders:
-            related_text = ""
-            if hasattr(reminder, 'related_name'):
-                related_text = reminder.related_name
-            else:
-                if reminder.related_type == "contact":
-                    contact = Contact.get_by_id(reminder.related_id)
-                    if contact:
-                        related_text = f"{contact.name} at {contact.company}"
-                elif reminder.related_type == "application":
-                    application = Application.get_by_id(reminder.related_id)
-                    if application:
-                        related_text = f"{application.title} at {application.name}"
-            
-            tree.insert("", "end", iid=reminder.id, values=(
+            reminder_data[str(reminder.id)] = reminder
+        
+        today = date.today()
+        
+        def to_row(reminder):
+            values = (
                 reminder.title,
-                related_text,
+                reminder.related_name,
                 reminder.description[:50] + "..." if len(reminder.description) > 50 else reminder.description,
-                reminder.due_date,
+                format_date(reminder.due_date, Reminder.DATE_FORMAT, "%m/%d/%Y"),
                 reminder.status
-            ))
-            
-            reminder_data[str(reminder.id)] = reminder
-            
-        highlight_overdue_reminders()
-    
-    def highlight_overdue_reminders():
-        """Highlight reminders that are overdue"""
-        today = datetime.now()
-        
-        for item_id in tree.get_children():
-            reminder_id = str(item_id)
-            if reminder_id in reminder_data:
-                reminder = reminder_data[reminder_id]
-                if reminder.status == "pending":
-                    try:
-                        due_date = datetime.strptime(reminder.due_date, "%m/%d/%Y")
-                        if due_date < today:
-                            tree.item(item_id, tags=("overdue",))
-                    except ValueError:
-                        pass
+            )
+            return str(reminder.id), values, overdue_tags(reminder, today)
         
-        tree.tag_configure("overdue", foreground="red")
+        tree.set_provider(ListRowProvider(reminders, to_row))
+    
+    def overdue_tags(reminder, today):
+        """Tags highlighting a reminder that is overdue"""
+        if reminder.status == "pending":
+            due_date = reminder.due_on()
+            if due_date and due_date <= today:
+                return ("overdue",)
+        return ()
     
     def show_context_menu(event):
         item_id = tree.identify_row(event.y)
@@ -213,25 +181,30 @@ def build_reminders_tab(parent, notebook):
             notebook.select(1)
             parent.event_generate("<<SelectApplication>>", data=related_id)
     
+    def update_reminder(reminder_id, change):
+        """Apply `change(reminder)` on the database worker, then refresh the list"""
+        def work():
+            reminder = Reminder.get_by_id(int(reminder_id))
+            if reminder:
+                change(reminder)
+        
+        run_in_background(tree, work, lambda result: refresh_reminders(status_var.get(), days_var.get()))
+    
     def mark_complete(reminder_id):
         """Mark a reminder as complete"""
-        reminder = Reminder.get_by_id(int(reminder_id))
-        if reminder:
-            reminder.mark_complete()
-            refresh_reminders(status_var.get(), days_var.get())
+        update_reminder(reminder_id, lambda reminder: reminder.mark_complete())
     
     def mark_pending(reminder_id):
         """Mark a reminder as pending"""
-        reminder = Reminder.get_by_id(int(reminder_id))
-        if reminder:
+        def set_pending(reminder):
             reminder.status = "pending"
             reminder.save()
-            refresh_reminders(status_var.get(), days_var.get())
+        
+        update_reminder(reminder_id, set_pending)
     
     def snooze_reminder(reminder_id):
         """Snooze a reminder to a later date"""
-        reminder = Reminder.get_by_id(int(reminder_id))
-        if not reminder:
+        if reminder_id not in reminder_data:
             return
             
         snooze_dialog = tk.Toplevel()
@@ -253,9 +226,8 @@ def build_reminders_tab(parent, notebook):
             pass
         
         def confirm_snooze():
-            new_date = date_picker.get_date().strftime("%m/%d/%Y")
-            reminder.snooze(new_date)
-            refresh_reminders(status_var.get(), days_var.get())
+            snooze_until = date_picker.get_date()
+            update_reminder(reminder_id, lambda reminder: reminder.snooze(snooze_until))
             snooze_dialog.destroy()
         
         button_frame = tk.Frame(snooze_dialog)
@@ -267,82 +239,64 @@ def build_reminders_tab(parent, notebook):
     def delete_reminder(reminder_id):
         """Delete a reminder"""
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this reminder?"):
-            reminder = Reminder.get_by_id(int(reminder_id))
-            if reminder:
-                reminder.delete()
-                refresh_reminders(status_var.get(), days_var.get())
+            update_reminder(reminder_id, lambda reminder: reminder.delete())
     
     def check_reminders():
-        """Check for upcoming reminders and show notification if needed"""
-        today = datetime.now().strftime("%m/%d/%Y")
-        due_reminders = Reminder.find_all(
-            "status = 'pending' AND julianday(due_date) <= julianday(?)", 
-            (today,)
-        )
+        """Check for reminders due today on the database worker and notify if there are any"""
+        check_task.run(lambda: Reminder.find_due_by(date.today()), show_due_reminders)
+    
+    def show_due_reminders(due_reminders):
+        """Show a notification listing the reminders that are due"""
+        if not due_reminders:
+            return
         
-        if due_reminders:
-            refresh_reminders(status_var.get(), days_var.get())
-            
-            remind_window = tk.Toplevel()
-            remind_window.title("Reminder Alert")
-            remind_window.geometry("400x300")
-            remind_window.transient(parent.master)
-            
-            tk.Label(
-                remind_window, 
-                text="You have reminders due today!", 
-                font=("Arial", 14, "bold")
-            ).pack(pady=10)
-            
-            list_frame = tk.Frame(remind_window)
-            list_frame.pack(fill="both", expand=True, padx=10)
-            
-            remind_list = tk.Listbox(list_frame, height=10, width=50)
-            remind_scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=remind_list.yview)
-            remind_list.configure(yscrollcommand=remind_scrollbar.set)
-            
-            remind_list.pack(side="left", fill="both", expand=True)
-            remind_scrollbar.pack(side="right", fill="y")
-            
-            for i, reminder in enumerate(due_reminders):
-                related_text = ""
-                if reminder.related_type == "contact":
-                    contact = Contact.get_by_id(reminder.related_id)
-                    if contact:
-                        related_text = f"{contact.name}"
-                elif reminder.related_type == "application":
-                    application = Application.get_by_id(reminder.related_id)
-                    if application:
-                        related_text = f"{application.title}"
-                
-                if related_text:
-                    remind_list.insert(tk.END, f"{reminder.title} ({related_text})")
-                else:
-                    remind_list.insert(tk.END, reminder.title)
-                
-                remind_list.itemconfig(i, {"reminder_id": reminder.id})
+        refresh_reminders(status_var.get(), days_var.get())
+        
+        remind_window = tk.Toplevel()
+        remind_window.title("Reminder Alert")
+        remind_window.geometry("400x300")
+        remind_window.transient(parent.master)
+        
+        tk.Label(
+            remind_window, 
+            text="You have reminders due today!", 
+            font=("Arial", 14, "bold")
+        ).pack(pady=10)
+        
+        list_frame = tk.Frame(remind_window)
+        list_frame.pack(fill="both", expand=True, padx=10)
+        
+        remind_list = tk.Listbox(list_frame, height=10, width=50)
+        remind_scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=remind_list.yview)
+        remind_list.configure(yscrollcommand=remind_scrollbar.set)
+        
+        remind_list.pack(side="left", fill="both", expand=True)
+        remind_scrollbar.pack(side="right", fill="y")
+        
+        for i, reminder in enumerate(due_reminders):
+            if reminder.related_name:
+                remind_list.insert(tk.END, f"{reminder.title} ({reminder.related_name})")
+            else:
+                remind_list.insert(tk.END, reminder.title)
             
-            button_frame = tk.Frame(remind_window)
-            button_frame.pack(pady=10)
+            remind_list.itemconfig(i, {"reminder_id": reminder.id})
+        
+        button_frame = tk.Frame(remind_window)
+        button_frame.pack(pady=10)
+        
+        def view_reminder_tab():
+            notebook.select(2)
+            remind_window.destroy()
             
-            def view_reminder_tab():
-                notebook.select(2)
-                remind_window.destroy()
-                
-            def snooze_all():
-                tomorrow = (datetime.now() + timedelta(days=1)).strftime("%m/%d/%Y")
-                for reminder in due_reminders:
-                    reminder.snooze(tomorrow)
-                refresh_reminders(status_var.get(), days_var.get())
-                remind_window.destroy()
-                
-            tk.Button(button_frame, text="View Reminders", command=view_reminder_tab).pack(side="left", padx=5)
-            tk.Button(button_frame, text="Snooze All to Tomorrow", command=snooze_all).pack(side="left", padx=5)
-            tk.Button(button_frame, text="Dismiss", command=remind_window.destroy).pack(side="left", padx=5)
+        def snooze_all():
+            tomorrow = date.today() + timedelta(days=1)
+            run_in_background(tree, lambda: Reminder.snooze_many(due_reminders, tomorrow),
+                              lambda result: refresh_reminders(status_var.get(), days_var.get()))
+            remind_window.destroy()
             
-            return len(due_reminders)
-        
-        return 0
+        tk.Button(button_frame, text="View Reminders", command=view_reminder_tab).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Snooze All to Tomorrow", command=snooze_all).pack(side="left", padx=5)
+        tk.Button(button_frame, text="Dismiss", command=remind_window.destroy).pack(side="left", padx=5)
     
     status_combo.bind("<<ComboboxSelected>>", lambda e: refresh_reminders(status_var.get(), days_var.get()))
     days_combo.bind("<<ComboboxSelected>>", lambda e: refresh_reminders(status_var.get(), days_var.get()))
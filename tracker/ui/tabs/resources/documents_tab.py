@@ -1,23 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import codecs
 import os
-import subprocess
-import tempfile
 from datetime import datetime
 from tracker.core.models import Document, Contact, Application
-from tracker.core.database import get_connection
-from tracker.utils.ui_components import create_search_frame, create_filter_combobox, truncate_text, format_date
+from tracker.utils.ui_components import (create_search_frame, create_filter_combobox, truncate_text, format_date,
+                                      create_progress_callback, VirtualTreeview, ListRowProvider,
+                                      BackgroundTask, LoadingIndicator, run_in_background)
 from tracker.utils.document_utils import open_document as utils_open_document
-
-try:
-    from PIL import Image, ImageTk
-    import fitz
-    HAS_PDF_PREVIEW = True
-except ImportError:
-    HAS_PDF_PREVIEW = False
+from tracker.utils.pdf_preview import (HAS_PDF_PREVIEW, MAX_PREVIEW_SIZE, PdfViewer, preview_key,
+                                       discard_previews, queue_preview)
 
 DOCUMENT_TYPES = ["Resume", "Cover Letter", "Portfolio", "References", "Other"]
-MAX_PREVIEW_SIZE = 5 * 1024 * 1024
+MAX_TEXT_PREVIEW_SIZE = 256 * 1024
 
 def build_documents_tab(parent):
     main_frame = tk.Frame(parent)
@@ -52,7 +47,7 @@ def build_documents_tab(parent):
     tree_frame.pack(fill="both", expand=True, pady=5)
     
     columns = ("Name", "Type", "Version", "Date Added")
-    tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="browse")
+    tree = VirtualTreeview(tree_frame, columns=columns, show="headings", selectmode="browse")
     
     for col in columns:
         tree.heading(col, text=col)
@@ -90,6 +85,8 @@ def build_documents_tab(parent):
     preview_canvas = tk.Canvas(preview_area_frame, bg="white")
     preview_canvas.pack(fill="both", expand=True, padx=5, pady=5)
     
+    pdf_viewer = PdfViewer(preview_area_frame) if HAS_PDF_PREVIEW else None
+    
     text_preview = tk.Text(preview_area_frame, wrap="word", height=20)
     text_preview_scrollbar = ttk.Scrollbar(preview_area_frame, orient="vertical", command=text_preview.yview)
     text_preview.configure(yscrollcommand=text_preview_scrollbar.set)
@@ -128,6 +125,9 @@ def build_documents_tab(parent):
     
     current_doc_id = None
     
+    list_task = BackgroundTask(tree, LoadingIndicator(actions_frame))
+    preview_task = BackgroundTask(preview_frame, LoadingIndicator(preview_content, side="top"))
+    
     def upload_document():
         """Open file dialog to select and upload a new document"""
         file_path = filedialog.askopenfilename(
@@ -177,32 +177,37 @@ def build_documents_tab(parent):
         notes_text.pack(side="left", fill="both", expand=True)
         notes_scrollbar.pack(side="right", fill="y")
         
+        progress_bar = ttk.Progressbar(popup, mode="determinate")
+        
         def save_document():
-            """Save the uploaded document to the database"""
-            try:
-                with open(file_path, "rb") as f:
-                    file_content = f.read()
-                
-                file_type = os.path.splitext(file_path)[1][1:] or "txt"
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                document = Document(
-                    name=name_var.get(),
-                    type=type_var.get(),
-                    version=version_var.get(),
-                    file_content=file_content,
-                    file_type=file_type,
-                    notes=notes_text.get("1.0", "end-1c"),
-                    created_at=current_time
-                )
-                document.save()
-                
+            """Save the uploaded document, copying the file in on the database worker"""
+            file_type = os.path.splitext(file_path)[1][1:] or "txt"
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
+            document = Document(
+                name=name_var.get(),
+                type=type_var.get(),
+                version=version_var.get(),
+                file_type=file_type,
+                notes=notes_text.get("1.0", "end-1c"),
+                created_at=current_time
+            )
+            
+            def uploaded(result):
+                queue_preview(document, file_path)
                 messagebox.showinfo("Success", "Document uploaded successfully!")
                 popup.destroy()
                 refresh_documents()
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to upload document: {e}")
+            
+            def failed(error):
+                finish_progress()
+                save_button.config(state="normal")
+                messagebox.showerror("Error", f"Failed to upload document: {error}")
+            
+            progress_bar.pack(fill="x", padx=20)
+            save_button.config(state="disabled")
+            progress, finish_progress = create_progress_callback(progress_bar)
+            run_in_background(popup, lambda: document.import_file(file_path, progress), uploaded, failed)
         
         button_frame = ttk.Frame(popup)
         button_frame.pack(pady=15)
@@ -288,15 +293,13 @@ def build_documents_tab(parent):
             for item in contacts_tree.get_children():
                 contacts_tree.delete(item)
             
-            document = Document.get_by_id(doc_id)
+            document = Document.get_by_id(doc_id, columns=("id",))
             if not document:
                 return
                 
-            linked_contacts = []
-            for usage in document.find_related('contact'):
-                linked_contacts.append(usage.id)
+            linked_contacts = document.find_linked_ids('contact')
                 
-            contacts = Contact.find_all()
+            contacts = Contact.find_all(columns=("name", "company", "title"))
             if search_text:
                 contacts = [c for c in contacts if search_text.lower() in c.name.lower() 
                            or search_text.lower() in c.company.lower()]
@@ -312,15 +315,13 @@ def build_documents_tab(parent):
             for item in app_tree.get_children():
                 app_tree.delete(item)
             
-            document = Document.get_by_id(doc_id)
+            document = Document.get_by_id(doc_id, columns=("id",))
             if not document:
                 return
                 
-            linked_applications = []
-            for usage in document.find_related('application'):
-                linked_applications.append(usage.id)
+            linked_applications = document.find_linked_ids('application')
                 
-            applications = Application.find_all()
+            applications = Application.find_all(columns=("title", "name", "status"))
             if search_text:
                 applications = [a for a in applications if search_text.lower() in a.title.lower() 
                                or search_text.lower() in a.name.lower()]
@@ -349,7 +350,7 @@ def build_documents_tab(parent):
         def link_selected():
             """Save selected links between document and contacts/applications"""
             tab_index = tab_control.index(tab_control.select())
-            document = Document.get_by_id(doc_id)
+            document = Document.get_by_id(doc_id, columns=("id",))
             
             if not document:
                 messagebox.showerror("Error", "Document not found")
@@ -357,19 +358,13 @@ def build_documents_tab(parent):
                 
             if tab_index == 0:
                 selected_items = contacts_tree.selection()
-                document.unlink_all_from('contact')
-                
-                for item_id in selected_items:
-                    document.link_to('contact', item_id)
+                document.replace_links('contact', [int(item_id) for item_id in selected_items])
                 
                 message = f"Document linked to {len(selected_items)} contact(s) successfully!"
                 
             else:
                 selected_items = app_tree.selection()
-                document.unlink_all_from('application')
-                
-                for item_id in selected_items:
-                    document.link_to('application', item_id)
+                document.replace_links('application', [int(item_id) for item_id in selected_items])
                 
                 message = f"Document linked to {len(selected_items)} application(s) successfully!"
             
@@ -387,9 +382,6 @@ def build_documents_tab(parent):
     
     def refresh_documents():
         """Refresh the document list with filtering applied"""
-        for item in tree.get_children():
-            tree.delete(item)
-        
         where_clause = ""
         params = []
         
@@ -397,106 +389,79 @@ def build_documents_tab(parent):
             where_clause = "type = ?"
             params.append(filter_var.get())
         
-        if search_var.get():
-            search_param = f"%{search_var.get()}%"
-            if where_clause:
-                where_clause += " AND (name LIKE ? OR version LIKE ? OR notes LIKE ?)"
-            else:
-                where_clause = "(name LIKE ? OR version LIKE ? OR notes LIKE ?)"
-            params.extend([search_param, search_param, search_param])
-        
-        documents = Document.find_all(where_clause, tuple(params))
+        search_text = search_var.get()
         
-        for doc in documents:
+        def to_row(doc):
             date_str = format_date(doc.created_at, "%Y-%m-%d %H:%M:%S", "%m/%d/%Y")
-            tree.insert("", "end", iid=doc.id, values=(doc.name, doc.type, doc.version, date_str))
+            return str(doc.id), (doc.name, doc.type, doc.version, date_str)
+        
+        list_task.run(
+            lambda: Document.search(search_text, where_clause, tuple(params), columns=Document.SUMMARY_COLUMNS),
+            lambda documents: tree.set_provider(ListRowProvider(documents, to_row))
+        )
     
     def clear_preview_area():
         """Clear the document preview area"""
         preview_canvas.delete("all")
         preview_canvas.pack(fill="both", expand=True)
         
+        if pdf_viewer:
+            pdf_viewer.clear()
+            pdf_viewer.pack_forget()
         text_preview.pack_forget()
         text_preview_scrollbar.pack_forget()
         text_preview.delete("1.0", "end")
     
-    def show_document_preview(file_content, file_type):
-        """Display preview of document content if possible"""
+    def show_message(text):
+        """Show `text` centered on the preview canvas"""
         clear_preview_area()
+        preview_canvas.create_text(
+            preview_canvas.winfo_width() // 2, 
+            preview_canvas.winfo_height() // 2,
+            text=text,
+            justify=tk.CENTER,
+            tags=("message",)
+        )
+    
+    def show_document_preview(key, source, file_type, file_size=None):
+        """
+        Display preview of document content if possible
         
-        if len(file_content) > MAX_PREVIEW_SIZE:
-            preview_canvas.create_text(
-                preview_canvas.winfo_width() // 2, 
-                preview_canvas.winfo_height() // 2,
-                text="File is too large to preview.\nPlease use the 'Open Document' button.",
-                justify=tk.CENTER
-            )
-            return
-            
+        `source` is the content as bytes, or for a PDF kept in the blob store
+        the path of its file.
+        """
+        clear_preview_area()
         file_type = file_type.lower()
         
+        if file_type == "pdf" and HAS_PDF_PREVIEW and source is not None:
+            preview_canvas.pack_forget()
+            pdf_viewer.pack(fill="both", expand=True)
+            pdf_viewer.show(key, source, on_error=lambda error: show_message(f"Failed to preview PDF: {error}"))
+            return
+        
+        if file_size is None:
+            file_size = len(source)
+        if file_size > MAX_PREVIEW_SIZE:
+            show_message("File is too large to preview.\nPlease use the 'Open Document' button.")
+            return
+        
         if file_type == "txt":
             preview_canvas.pack_forget()
             text_preview.pack(side="left", fill="both", expand=True)
             text_preview_scrollbar.pack(side="right", fill="y")
             
             try:
-                text_content = file_content.decode('utf-8')
+                # Only the start of the file was loaded, so its last character may be cut in half
+                text_content = codecs.getincrementaldecoder("utf-8")().decode(bytes(source))
+                if file_size > len(source):
+                    text_content += "\n\n[Preview truncated. Use 'Open Document' to see the whole file.]"
                 text_preview.insert("1.0", text_content)
                 text_preview.config(state="disabled")
             except UnicodeDecodeError:
                 text_preview.insert("1.0", "Unable to decode text content.")
                 text_preview.config(state="disabled")
-                
-        elif file_type == "pdf" and HAS_PDF_PREVIEW:
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                    tmp.write(file_content)
-                    tmp_path = tmp.name
-                
-                pdf_document = fitz.open(tmp_path)
-                if pdf_document.page_count > 0:
-                    page = pdf_document.load_page(0)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5))
-                    
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    
-                    canvas_width = preview_canvas.winfo_width() or 400
-                    canvas_height = preview_canvas.winfo_height() or 400
-                    
-                    img_ratio = img.width / img.height
-                    canvas_ratio = canvas_width / canvas_height
-                    
-                    if img_ratio > canvas_ratio:
-                        new_width = canvas_width
-                        new_height = int(canvas_width / img_ratio)
-                    else:
-                        new_height = canvas_height
-                        new_width = int(canvas_height * img_ratio)
-                    
-                    img = img.resize((new_width, new_height), Image.LANCZOS)
-                    
-                    photo = ImageTk.PhotoImage(img)
-                    preview_canvas.create_image(canvas_width//2, canvas_height//2, image=photo, anchor=tk.CENTER)
-                    
-                    preview_canvas.image = photo
-                    
-                pdf_document.close()
-                os.unlink(tmp_path)
-            except Exception as e:
-                preview_canvas.create_text(
-                    preview_canvas.winfo_width() // 2, 
-                    preview_canvas.winfo_height() // 2,
-                    text=f"Failed to preview PDF: {e}",
-                    justify=tk.CENTER
-                )
         else:
-            preview_canvas.create_text(
-                preview_canvas.winfo_width() // 2, 
-                preview_canvas.winfo_height() // 2,
-                text=f"Preview not available for {file_type} files.\n\nUse 'Open Document' to view.",
-                justify=tk.CENTER
-            )
+            show_message(f"Preview not available for {file_type} files.\n\nUse 'Open Document' to view.")
 
     def on_document_select(event):
         """Handle selection of a document in the tree view"""
@@ -509,8 +474,30 @@ def build_documents_tab(parent):
         item_id = selected_items[0]
         current_doc_id = item_id
         
-        document = Document.get_by_id(item_id)
-        
+        def load():
+            document = Document.get_by_id(item_id, columns=Document.SUMMARY_COLUMNS + ("notes",))
+            if not document:
+                return None, None
+            file_type = (document.file_type or "").lower()
+            if file_type == "pdf" and HAS_PDF_PREVIEW:
+                path = document.content_path()
+                if path:
+                    # The viewer reads pages straight from the file, whatever its size
+                    return document, path
+            if (document.file_size or 0) > MAX_PREVIEW_SIZE:
+                # Too large to preview, so don't read it at all
+                return document, None
+            with document.open_content() as content:
+                if not content:
+                    return document, None
+                if file_type == "txt":
+                    return document, bytes(content[:MAX_TEXT_PREVIEW_SIZE])
+                return document, bytes(content)
+        
+        preview_task.run(load, lambda result: show_document(*result))
+    
+    def show_document(document, source):
+        """Fill the preview pane once the selected document has been loaded"""
         if not document:
             return
         
@@ -527,8 +514,11 @@ def build_documents_tab(parent):
             notes_text.insert("1.0", document.notes)
         notes_text.config(state="disabled")
         
-        if document.file_content:
-            show_document_preview(document.file_content, document.file_type)
+        if source or (document.file_size or 0) > MAX_PREVIEW_SIZE:
+            show_document_preview(preview_key(document), source, document.file_type,
+                                  document.file_size or len(source))
+        else:
+            clear_preview_area()
         
         open_button.config(state="normal")
         link_button.config(state="normal")
@@ -564,7 +554,7 @@ def build_documents_tab(parent):
     
     def edit_document_details(doc_id):
         """Edit document metadata"""
-        document = Document.get_by_id(doc_id)
+        document = Document.get_by_id(doc_id, columns=("name", "type", "version", "notes", "content_hash"))
         if not document:
             messagebox.showerror("Error", "Document not found.")
             return
@@ -607,11 +597,14 @@ def build_documents_tab(parent):
         
         def save_changes():
             """Save document detail changes"""
+            old_key = preview_key(document)
             document.name = name_var.get()
             document.type = type_var.get()
             document.version = version_var.get()
             document.notes = notes_text.get("1.0", "end-1c")
             document.save()
+            if preview_key(document) != old_key:
+                discard_previews(old_key)
             
             messagebox.showinfo("Success", "Document details updated.")
             popup.destroy()
@@ -635,9 +628,16 @@ def build_documents_tab(parent):
         if not confirm:
             return
         
-        document = Document.get_by_id(doc_id)
+        if doc_id == current_doc_id and pdf_viewer:
+            # Close the previewed file first, or Windows won't let the blob be removed
+            closing = pdf_viewer.clear()
+            if closing:
+                closing.result()
+        
+        document = Document.get_by_id(doc_id, columns=("id", "version", "content_hash"))
         if document:
             document.delete()
+            discard_previews(preview_key(document))
         
         messagebox.showinfo("Success", "Document deleted successfully.")
         refresh_documents()
@@ -662,7 +662,7 @@ def build_documents_tab(parent):
     
     def view_document_usage(doc_id):
         """View where document is being used"""
-        document = Document.get_by_id(doc_id)
+        document = Document.get_by_id(doc_id, columns=Document.SUMMARY_COLUMNS)
         if not document:
             messagebox.showerror("Error", "Document not found.")
             return
@@ -674,8 +674,8 @@ def build_documents_tab(parent):
         
         ttk.Label(popup, text=f"Usage History for: {document.name}", font=("Arial", 12, "bold")).pack(pady=10)
         
-        contact_usages = document.find_related('contact')
-        application_usages = document.find_related('application')
+        contact_usages = document.find_linked_ids('contact')
+        application_usages = document.find_linked_ids('application')
         
         if not contact_usages and not application_usages:
             ttk.Label(popup, text="This document hasn't been linked to any contacts or applications yet.").pack(pady=20)
@@ -694,14 +694,14 @@ def build_documents_tab(parent):
             usage_tree.pack(fill="both", expand=True, padx=10, pady=10)
             scrollbar.pack(side="right", fill="y")
             
-            for contact in contact_usages:
-                contact = Contact.get_by_id(contact.id)
+            for contact_id in contact_usages:
+                contact = Contact.get_by_id(contact_id)
                 if contact:
                     date_str = format_date(document.created_at, "%Y-%m-%d %H:%M:%S", "%m/%d/%Y")
                     usage_tree.insert("", "end", values=("Contact", contact.name, date_str))
             
-            for app in application_usages:
-                application = Application.get_by_id(app.id)
+            for app_id in application_usages:
+                application = Application.get_by_id(app_id)
                 if application:
                     item_name = f"{application.title} at {application.name}"
                     date_str = format_date(document.created_at, "%Y-%m-%d %H:%M:%S", "%m/%d/%Y")
@@ -718,19 +718,17 @@ def build_documents_tab(parent):
     usage_button.config(command=lambda: view_document_usage(current_doc_id), state="disabled")
     
     def configure_sash(event=None):
-        """Configure the paned window sash position"""
+        """Split the paned window evenly once it has a real width, then leave the sash to the user"""
         width = paned_window.winfo_width()
         if width > 1:
             paned_window.sashpos(0, width // 2)
+            paned_window.unbind("<Configure>", sash_binding)
     
-    paned_window.bind("<Configure>", configure_sash)
+    sash_binding = paned_window.bind("<Configure>", configure_sash)
     
-    def on_resize(event=None):
-        """Update document preview when window is resized"""
-        if current_doc_id:
-            document = Document.get_by_id(current_doc_id)
-            if document:
-                show_document_preview(document.file_content, document.file_type)
+    def on_resize(event):
+        """Keep the preview message centered when the canvas is resized"""
+        preview_canvas.coords("message", event.width // 2, event.height // 2)
     
     preview_canvas.bind("<Configure>", on_resize)
     
@@ -3,6 +3,7 @@ from tkinter import ttk, messagebox
 from datetime import datetime
 
 from tracker.core.models import MessageTemplate
+from tracker.utils.ui_components import Debouncer, sync_treeview, BackgroundTask
 
 def build_templates_tab(parent):
     """Build the message templates tab"""
@@ -71,29 +72,27 @@ def build_templates_tab(parent):
     
     content_text.config(state="disabled")
     
+    refresh_task = BackgroundTask(tree)
+    
     def refresh_templates(search_text="", category_filter="All"):
         """Refresh the templates list based on filters"""
-        for item in tree.get_children():
-            tree.delete(item)
-            
         where_clause = []
         params = []
         
-        if search_text:
-            where_clause.append("(name LIKE ? OR content LIKE ?)")
-            search_param = f"%{search_text}%"
-            params.extend([search_param, search_param])
-        
         if category_filter != "All":
             where_clause.append("category = ?")
             params.append(category_filter)
         
         final_where = " AND ".join(where_clause) if where_clause else ""
         
-        templates = MessageTemplate.find_all(final_where, tuple(params))
-        
-        templates.sort(key=lambda t: t.name or "")
-        
+        refresh_task.run(
+            lambda: MessageTemplate.search(search_text, final_where, tuple(params), order_by="name",
+                                           columns=("name", "category", "created_at", "updated_at")),
+            show_templates
+        )
+    
+    def show_templates(templates):
+        rows = []
         for template in templates:
             date_display = ""
             date_value = template.updated_at or template.created_at or ""
@@ -104,11 +103,13 @@ def build_templates_tab(parent):
                 except ValueError:
                     date_display = date_value
             
-            tree.insert("", "end", iid=template.id, values=(
+            rows.append((template.id, (
                 template.name,
                 template.category,
                 date_display
-            ))
+            )))
+        
+        sync_treeview(tree, rows)
     
     def show_template_content(event=None):
         """Show the selected template content"""
@@ -269,7 +270,9 @@ def build_templates_tab(parent):
                 content_text.delete(1.0, tk.END)
                 content_text.config(state="disabled")
     
-    search_var.trace("w", lambda *args: refresh_templates(search_var.get(), category_var.get()))
+    search_debouncer = Debouncer(search_entry, lambda: refresh_templates(search_var.get(), category_var.get()))
+    search_var.trace_add("write", search_debouncer)
+    search_entry.bind("<Return>", lambda e: search_debouncer.flush())
     category_combo.bind("<<ComboboxSelected>>", lambda e: refresh_templates(search_var.get(), category_var.get()))
     
     refresh_templates()
\ No newline at end of file
@@ -1,19 +1,22 @@
 import tkinter as tk
 from tkinter import ttk
-from tracker.ui.tabs.resources.documents_tab import build_documents_tab
-from tracker.ui.tabs.resources.templates_tab import build_templates_tab
+from tracker.utils.ui_components import LazyTabs
 
 def build_resources_tab(parent):
-    """Build the resources tab with documents and templates"""
+    """Build the resources tab with documents and templates, each on first view"""
     resources_notebook = ttk.Notebook(parent)
     resources_notebook.pack(fill="both", expand=True)
     
-    documents_tab = ttk.Frame(resources_notebook)
-    templates_tab = ttk.Frame(resources_notebook)
+    def build_documents(frame):
+        from tracker.ui.tabs.resources.documents_tab import build_documents_tab
+        build_documents_tab(frame)
     
-    resources_notebook.add(documents_tab, text="Documents")
-    resources_notebook.add(templates_tab, text="Message Templates")
+    def build_templates(frame):
+        from tracker.ui.tabs.resources.templates_tab import build_templates_tab
+        build_templates_tab(frame)
     
-    build_documents_tab(documents_tab)
+    tabs = LazyTabs(resources_notebook)
+    documents_tab = tabs.add("Documents", build_documents)
+    tabs.add("Message Templates", build_templates)
     
-    build_templates_tab(templates_tab)
\ No newline at end of file
+    tabs.ensure_built(documents_tab)
\ No newline at end of file
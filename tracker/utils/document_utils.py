@@ -5,36 +5,60 @@ import os
 import subprocess
 import tempfile
 from tracker.core.models import Document, Contact, Application
+from tracker.utils.ui_components import create_progress_callback, run_in_background
+from tracker.utils.pdf_preview import queue_preview
 
 def open_document(doc_id, parent=None):
-    """Open a document with the default application"""
-    document = Document.get_by_id(doc_id)
+    """
+    Open a document with the default application
     
-    if not document:
-        messagebox.showerror("Error", "Document not found.")
-        return
+    With a `parent` widget the file is exported on the database worker and
+    opened once it is ready; without one it is done immediately.
+    """
+    def export():
+        document = Document.get_by_id(doc_id, columns=Document.SUMMARY_COLUMNS)
+        if not document:
+            return None
+        
+        temp_dir = os.path.join(os.path.expanduser("~"), ".outreach_tracker")
+        os.makedirs(temp_dir, exist_ok=True)
+        
+        temp_path = os.path.join(temp_dir, f"{document.name}.{document.file_type}")
+        with open(temp_path, "wb") as f:
+            document.export_to(f)
+        return temp_path
+    
+    def launch(temp_path):
+        if not temp_path:
+            messagebox.showerror("Error", "Document not found.")
+            return
+        
+        try:
+            if os.name == 'nt':
+                os.startfile(temp_path)
+            elif os.name == 'posix':
+                opener = 'open' if os.uname().sysname == 'Darwin' else 'xdg-open'
+                subprocess.call([opener, temp_path])
+        except Exception as e:
+            failed(e)
     
-    temp_dir = os.path.join(os.path.expanduser("~"), ".outreach_tracker")
-    os.makedirs(temp_dir, exist_ok=True)
+    def failed(error):
+        messagebox.showerror("Error", f"Failed to open document: {error}")
     
-    temp_path = os.path.join(temp_dir, f"{document.name}.{document.file_type}")
+    if parent is not None:
+        run_in_background(parent, export, launch, failed)
+        return
     
     try:
-        with open(temp_path, "wb") as f:
-            f.write(document.file_content)
-        
-        if os.name == 'nt':
-            os.startfile(temp_path)
-        elif os.name == 'posix':
-            opener = 'open' if os.uname().sysname == 'Darwin' else 'xdg-open'
-            subprocess.call([opener, temp_path])
-        
+        temp_path = export()
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to open document: {e}")
+        failed(e)
+        return
+    launch(temp_path)
 
 def view_document_details(doc_id, parent):
     """View document details in a popup"""
-    document = Document.get_by_id(doc_id)
+    document = Document.get_by_id(doc_id, columns=Document.SUMMARY_COLUMNS + ("notes",))
     
     if not document:
         messagebox.showerror("Error", "Document not found.")
@@ -76,7 +100,7 @@ def view_document_details(doc_id, parent):
     button_frame = ttk.Frame(popup)
     button_frame.pack(fill="x", pady=10)
     
-    open_btn = ttk.Button(button_frame, text="Open Document", command=lambda: open_document(doc_id))
+    open_btn = ttk.Button(button_frame, text="Open Document", command=lambda: open_document(doc_id, popup))
     open_btn.pack(side="left", padx=5)
     
     close_btn = ttk.Button(button_frame, text="Close", command=popup.destroy)
@@ -85,7 +109,7 @@ def view_document_details(doc_id, parent):
 def unlink_document(doc_id, item_id, item_type, parent=None, callback=None):
     """Unlink a document from an item (contact or application)"""
     if messagebox.askyesno("Confirm", "Remove link to this document?"):
-        document = Document.get_by_id(doc_id)
+        document = Document.get_by_id(doc_id, columns=("id",))
         if document:
             document.unlink_from(item_type, item_id)
             
@@ -141,33 +165,40 @@ def upload_document(parent, item_id=None, item_type=None, callback=None):
     notes_text.pack(side="left", fill="both", expand=True)
     notes_scrollbar.pack(side="right", fill="y")
     
+    progress_bar = ttk.Progressbar(upload_popup, mode="determinate")
+    
     def save_uploaded_document():
-        try:
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-            
-            file_type = os.path.splitext(file_path)[1][1:] or "txt"
-            
-            document = Document(
-                name=name_var.get(),
-                type=type_var.get(),
-                version=version_var.get(),
-                file_content=file_content,
-                file_type=file_type,
-                notes=notes_text.get("1.0", "end-1c")
-            )
-            document.save()
-            
+        file_type = os.path.splitext(file_path)[1][1:] or "txt"
+        
+        document = Document(
+            name=name_var.get(),
+            type=type_var.get(),
+            version=version_var.get(),
+            file_type=file_type,
+            notes=notes_text.get("1.0", "end-1c")
+        )
+        progress, finish_progress = create_progress_callback(progress_bar)
+        
+        def store():
+            """Copy the file in and link it (runs on the database worker)"""
+            document.import_file(file_path, progress)
             if item_id and item_type:
                 document.link_to(item_type, item_id)
-            
+        
+        def stored(result):
+            queue_preview(document, file_path)
             upload_popup.destroy()
-            
             if callback:
                 callback()
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to upload document: {e}")
+        
+        def failed(error):
+            finish_progress()
+            save_button.config(state="normal")
+            messagebox.showerror("Error", f"Failed to upload document: {error}")
+        
+        progress_bar.pack(fill="x", padx=20)
+        save_button.config(state="disabled")
+        run_in_background(upload_popup, store, stored, failed)
     
     button_frame = ttk.Frame(upload_popup)
     button_frame.pack(pady=15)
@@ -230,17 +261,14 @@ def manage_linked_documents(item_id, item_type, parent):
     checked_items = {}
     
     def load_documents():
-        for item in doc_tree.get_children():
-            doc_tree.delete(item)
+        for row in doc_tree.get_children():
+            doc_tree.delete(row)
         
         checked_items.clear()
         
-        all_documents = Document.find_all()
+        all_documents = Document.find_all(columns=Document.SUMMARY_COLUMNS)
         
-        if item_type == 'contact':
-            linked_docs = Contact.get_by_id(item_id).get_linked_documents()
-        else:
-            linked_docs = Application.get_by_id(item_id).get_linked_documents()
+        linked_docs = item.get_linked_documents(columns=("id",))
         
         linked_doc_ids = [doc.id for doc in linked_docs]
         
@@ -275,15 +303,10 @@ def manage_linked_documents(item_id, item_type, parent):
     doc_tree.bind("<Button-1>", on_doc_tree_click)
     
     def save_document_links():
-        for tree_item_id, info in checked_items.items():
-            doc_id = info["doc_id"]
-            is_checked = info["checked"]
-            document = Document.get_by_id(doc_id)
-            
-            if is_checked:
-                document.link_to(item_type, item_id)
-            else:
-                document.unlink_from(item_type, item_id)
+        links = [(info["doc_id"], item_type, int(item_id)) for info in checked_items.values() if info["checked"]]
+        unlinks = [(info["doc_id"], item_type, int(item_id)) for info in checked_items.values() if not info["checked"]]
+        
+        Document.update_links(links, unlinks)
         
         messagebox.showinfo("Success", "Document links updated successfully!")
         popup.destroy()
@@ -337,7 +360,7 @@ def manage_linked_documents(item_id, item_type, parent):
         item_id_tree = selected_items[0]
         if item_id_tree in checked_items:
             doc_id = checked_items[item_id_tree]["doc_id"]
-            open_document(doc_id)
+            open_document(doc_id, popup)
     
     view_btn = ttk.Button(button_frame, text="View Selected", command=view_selected_document)
     view_btn.pack(side="right", padx=5)
@@ -366,10 +389,7 @@ def view_linked_documents(item_id, item_type, parent):
             return
         item_title = f"{item.title} at {item.name}"
     
-    if item_type == 'contact':
-        documents = Contact.get_by_id(item_id).get_linked_documents()
-    else:
-        documents = Application.get_by_id(item_id).get_linked_documents()
+    documents = item.get_linked_documents(columns=Document.SUMMARY_COLUMNS)
     
     popup = tk.Toplevel(parent)
     popup.title(f"Documents for: {item.name if item_type == 'contact' else item.title}")
@@ -414,7 +434,7 @@ def view_linked_documents(item_id, item_type, parent):
         def on_doc_double_click(event):
             item_id_tree = doc_tree.identify_row(event.y)
             if item_id_tree:
-                open_document(item_id_tree)
+                open_document(item_id_tree, popup)
                 
         doc_tree.bind("<Double-1>", on_doc_double_click)
         
@@ -428,7 +448,7 @@ def view_linked_documents(item_id, item_type, parent):
             context_menu = tk.Menu(doc_tree, tearoff=0)
             context_menu.add_command(
                 label="Open Document", 
-                command=lambda: open_document(item_id_tree)
+                command=lambda: open_document(item_id_tree, popup)
             )
             context_menu.add_command(
                 label="View Details", 
@@ -452,7 +472,7 @@ def view_linked_documents(item_id, item_type, parent):
         button_frame.pack(fill="x", pady=10)
         
         open_btn = ttk.Button(button_frame, text="Open Selected", 
-                           command=lambda: open_document(doc_tree.selection()[0]) if doc_tree.selection() else None)
+                           command=lambda: open_document(doc_tree.selection()[0], popup) if doc_tree.selection() else None)
         open_btn.pack(side="left", padx=5)
         
         manage_btn = ttk.Button(button_frame, text="Manage Documents", 
@@ -0,0 +1,534 @@
+import bisect
+import glob
+import hashlib
+import importlib.util
+import os
+import tempfile
+import threading
+import tkinter as tk
+from tkinter import ttk
+from collections import OrderedDict
+
+from tracker.core.executor import RENDER, submit_to
+from tracker.utils.ui_components import Debouncer, run_in_background
+
+# PIL and PyMuPDF take longer to import than the rest of the app, so they
+# are only located here and imported by _import_pdf_stack on first use
+HAS_PDF_PREVIEW = all(importlib.util.find_spec(name) is not None for name in ("PIL", "fitz"))
+Image = ImageTk = fitz = None
+
+PREVIEW_DIR = os.path.join(os.path.expanduser("~"), ".outreach_tracker", "previews")
+MAX_PREVIEW_SIZE = 5 * 1024 * 1024
+# Rendered pages are stored as JPEG, about a tenth of a fast PNG. The
+# directory is capped and the least recently used files go first.
+PREVIEW_QUALITY = 85
+MAX_PREVIEW_DISK_BYTES = 200 * 1024 * 1024
+RENDER_ZOOM = 1.5
+THUMBNAIL_SIZE = 200
+MAX_CACHED_PAGES = 8
+MAX_CACHED_FITS = 24
+MAX_CACHED_THUMBNAILS = 64
+# Pages are rendered at widths rounded down to a multiple of this, so most
+# resize steps reuse the images already on screen
+WIDTH_STEP = 48
+RESIZE_DELAY_MS = 100
+
+class RenderCache:
+    """A thread-safe LRU of rendered images, shared by the Tk and render threads"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+
+    def discard(self, preview_key):
+        """Drop every image rendered for `preview_key`"""
+        with self._lock:
+            for key in [key for key in self._images if key[0] == preview_key]:
+                del self._images[key]
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+
+# Full-resolution first-page rasters, keyed by (preview key, page number)
+_pages = RenderCache(MAX_CACHED_PAGES)
+# Pages rendered at a display width, keyed by (preview key, page number, width)
+_fitted = RenderCache(MAX_CACHED_FITS)
+# The most recent display rendering of each page, keyed by (preview key, page number)
+_latest = RenderCache(MAX_CACHED_FITS)
+# Small first-page images, keyed by (preview key,)
+_thumbnails = RenderCache(MAX_CACHED_THUMBNAILS)
+
+def _import_pdf_stack() -> None:
+    global Image, ImageTk, fitz
+    if fitz is None:
+        from PIL import Image, ImageTk
+        import fitz
+
+def preview_key(document) -> tuple:
+    """
+    Return the key previews of `document` are cached under
+
+    Previews are tied to the content hash and version, so they are shared by
+    identical uploads and go stale when either changes. Documents without a
+    hash are only cached in memory, under their id.
+    """
+    if document.content_hash:
+        return (document.content_hash, document.version or "")
+    return (None, document.id)
+
+def _disk_path(key, name):
+    content_hash, version = key
+    if not content_hash:
+        return None
+    version_tag = hashlib.sha1(str(version).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(PREVIEW_DIR, content_hash[:2], f"{content_hash}-{version_tag}-{name}.jpg")
+
+def _load_image(key, name):
+    path = _disk_path(key, name)
+    if path is None or not os.path.exists(path):
+        return None
+    _import_pdf_stack()
+    try:
+        with Image.open(path) as image:
+            image.load()
+        # The modification time doubles as the last use for eviction
+        os.utime(path)
+        return image
+    except OSError:
+        # A damaged file is simply rendered again
+        return None
+
+# Bytes in PREVIEW_DIR, counted on the first save and kept up to date after
+_disk_usage = None
+_disk_lock = threading.Lock()
+
+def _preview_files():
+    for directory, _, names in os.walk(PREVIEW_DIR):
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                yield path, os.stat(path)
+            except OSError:
+                pass
+
+def _account_disk_usage(saved, added) -> None:
+    """Add `added` bytes to the directory total and evict old previews above the cap, except `saved`"""
+    global _disk_usage
+    with _disk_lock:
+        if _disk_usage is None:
+            _disk_usage = sum(stat.st_size for _, stat in _preview_files())
+        else:
+            _disk_usage += added
+        if _disk_usage <= MAX_PREVIEW_DISK_BYTES:
+            return
+
+        # Evict down to 80% of the cap so this doesn't run on every save
+        files = sorted(_preview_files(), key=lambda item: item[1].st_mtime)
+        _disk_usage = sum(stat.st_size for _, stat in files)
+        for path, stat in files:
+            if _disk_usage <= MAX_PREVIEW_DISK_BYTES * 0.8:
+                break
+            if path == saved:
+                continue
+            try:
+                os.unlink(path)
+                _disk_usage -= stat.st_size
+            except OSError:
+                pass
+
+def _save_image(key, name, image) -> None:
+    """Write `image` to the preview directory; failures only cost a re-render later"""
+    path = _disk_path(key, name)
+    if path is None:
+        return
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".jpg")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if image.mode not in ("RGB", "L"):
+                    image = image.convert("RGB")
+                image.save(f, "JPEG", quality=PREVIEW_QUALITY, optimize=True)
+                size = f.tell()
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        _account_disk_usage(path, size)
+    except OSError:
+        pass
+
+def _save_page(key, page_number, page) -> None:
+    _save_image(key, f"p{page_number}", page)
+    if page_number == 0:
+        thumbnail = page.copy()
+        thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE * 2), Image.LANCZOS)
+        _thumbnails.put((key,), thumbnail)
+        _save_image(key, "thumb", thumbnail)
+
+def discard_previews(key) -> None:
+    """Forget everything rendered for `key`, in memory and on disk"""
+    _pages.discard(key)
+    _fitted.discard(key)
+    _latest.discard(key)
+    _thumbnails.discard(key)
+
+    path = _disk_path(key, "*")
+    if path is None:
+        return
+    # Also matches previews written in an older format
+    for stale in glob.glob(os.path.splitext(path)[0] + ".*"):
+        try:
+            os.unlink(stale)
+        except OSError:
+            pass
+
+def fit_size(width, height, max_width, max_height=None) -> tuple:
+    """
+    Return the largest size with the aspect ratio of `width` x `height` that fits the box
+
+    Without `max_height` the size only has to fit `max_width`.
+    """
+    if max_height is None or width * max_height > max_width * height:
+        return max_width, max(1, int(max_width * height / width))
+    return max(1, int(max_height * width / height)), max_height
+
+class PdfSource:
+    """
+    An open PDF that pages are rendered from on demand
+
+    Given a file path, MuPDF only reads the parts of the file a page needs,
+    so large portfolios are never loaded whole; bytes are read from memory.
+    Not thread-safe: create, use and close it on the render worker only.
+    """
+
+    def __init__(self, source):
+        _import_pdf_stack()
+        if isinstance(source, str):
+            # Blob store files have no extension, so name the type
+            self.document = fitz.open(source, filetype="pdf")
+        else:
+            self.document = fitz.open(stream=bytes(source), filetype="pdf")
+        self.page_sizes = [(page.rect.width, page.rect.height) for page in self.document]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_sizes)
+
+    def render(self, page_number, zoom=RENDER_ZOOM, width=None):
+        """Rasterize one page, at `zoom` or scaled to `width` pixels across"""
+        if width is not None:
+            zoom = width / self.page_sizes[page_number][0]
+        pix = self.document.load_page(page_number).get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+    def close(self) -> None:
+        self.document.close()
+
+def thumbnail(key):
+    """Return the small first-page image for `key` if it has been rendered before"""
+    image = _thumbnails.get((key,))
+    if image is None:
+        image = _load_image(key, "thumb")
+        if image is not None:
+            _thumbnails.put((key,), image)
+    return image
+
+def cached_preview(key, page_number, width):
+    """
+    Return `(image, exact)` for a page at `width` without rendering anything
+
+    `exact` is True when the image was rendered for exactly this width.
+    Otherwise the page's last rendering is scaled nearest-neighbour (well
+    under a millisecond), so a resize can redraw at once while the sharp
+    version is rendered, and the first page falls back to its stored
+    thumbnail. The image is None if the page hasn't been rendered yet.
+    """
+    fitted = _fitted.get((key, page_number, width))
+    if fitted is not None:
+        return fitted, True
+
+    page = _latest.get((key, page_number)) or _pages.get((key, page_number))
+    if page is not None:
+        return page.resize(fit_size(page.width, page.height, width), Image.NEAREST), False
+
+    small = thumbnail(key) if page_number == 0 else None
+    if small is None:
+        return None, False
+    # Upscaling from a thumbnail is cheap enough to smooth
+    return small.resize(fit_size(small.width, small.height, width), Image.BILINEAR), False
+
+def _first_page(key, source):
+    page = _pages.get((key, 0))
+    if page is not None:
+        return page
+
+    page = _load_image(key, "p0")
+    if page is None:
+        page = source.render(0)
+        # Encoding takes longer than rendering, so do it after this preview is shown
+        submit_to(RENDER, _save_page, key, 0, page)
+    _pages.put((key, 0), page)
+    return page
+
+def render_preview(key, source, page_number, width):
+    """
+    Return a page of the open PdfSource `source` rendered `width` pixels across
+
+    Meant to run on the render worker. The first page is resampled from its
+    stored raster when there is one; other pages are rendered at the exact
+    scale, which needs no resampling at all.
+    """
+    if page_number == 0:
+        page = _first_page(key, source)
+        fitted = page.resize(fit_size(page.width, page.height, width), Image.LANCZOS)
+    else:
+        fitted = source.render(page_number, width=width)
+    _fitted.put((key, page_number, width), fitted)
+    _latest.put((key, page_number), fitted)
+    return fitted
+
+def queue_preview(document, path) -> None:
+    """Render the first page of a freshly uploaded PDF on the render worker"""
+    if not HAS_PDF_PREVIEW or (document.file_type or "").lower() != "pdf":
+        return
+    key = preview_key(document)
+    if _disk_path(key, "p0") is None:
+        return
+
+    def render():
+        if _load_image(key, "thumb") is not None:
+            return
+        source = PdfSource(path)
+        try:
+            if source.page_count:
+                _save_page(key, 0, source.render(0))
+        finally:
+            source.close()
+
+    submit_to(RENDER, render)
+
+class PdfViewer(ttk.Frame):
+    """
+    A scrollable view of every page of a PDF
+
+    Pages are laid out from their sizes as soon as the file is open, but
+    each is only rendered, on the render worker, once it scrolls into view.
+    Images of pages far from the view are dropped, so memory stays bounded
+    however long the document is. Resizes that stay within a WIDTH_STEP
+    only recentre the pages; larger ones re-render once the drag pauses.
+    """
+    PAGE_GAP = 10
+    PREFETCH_PAGES = 1
+    KEEP_PAGES = 3
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.canvas = tk.Canvas(self, bg="gray85", highlightthickness=0, yscrollincrement=20)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.key = None
+        self._source = None
+        self._generation = 0
+        self._page_sizes = []
+        self._tops = []
+        self._width = 0
+        self._offset = 0
+        # page number -> (width, PhotoImage, exact)
+        self._photos = {}
+        self._pending = set()
+        self._wanted = frozenset()
+        self._update_id = None
+        self._relayout = Debouncer(self, self._layout, RESIZE_DELAY_MS)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-3, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(3, "units"))
+
+    def show(self, key, source, on_error=None):
+        """
+        Display the PDF in `source` (a file path or bytes), cached under `key`
+
+        The first page is drawn from its stored thumbnail, if any, while the
+        file is opened. `on_error(error)` is called if it can't be opened.
+        """
+        self.clear()
+        self.key = key
+        generation = self._generation
+
+        small = thumbnail(key)
+        if small is not None:
+            self._page_sizes = [(small.width, small.height)]
+            self._layout()
+
+        def opened(pdf):
+            if generation != self._generation:
+                submit_to(RENDER, pdf.close)
+                return
+            self._source = pdf
+            self._page_sizes = pdf.page_sizes
+            self._layout()
+
+        def failed(error):
+            if generation == self._generation:
+                self.clear()
+                if on_error:
+                    on_error(error)
+
+        run_in_background(self, lambda: PdfSource(source), opened, failed, pool=RENDER)
+
+    def clear(self):
+        """
+        Forget the current PDF
+
+        Returns the future of closing its file on the render worker, or None.
+        """
+        self._generation += 1
+        self._relayout.cancel()
+        self.key = None
+        self._page_sizes = []
+        self._tops = []
+        self._photos.clear()
+        self._pending.clear()
+        self._wanted = frozenset()
+        self.canvas.delete("all")
+        self.canvas.configure(scrollregion=(0, 0, 0, 0))
+        self.canvas.yview_moveto(0)
+
+        source, self._source = self._source, None
+        if source is not None:
+            return submit_to(RENDER, source.close)
+        return None
+
+    def _page_width(self):
+        """Return the width pages are shown at: the room available, rounded down to a WIDTH_STEP"""
+        available = self.canvas.winfo_width() - 2 * self.PAGE_GAP
+        if available < WIDTH_STEP:
+            return max(1, available)
+        return available - available % WIDTH_STEP
+
+    def _on_configure(self, event):
+        if not self._tops:
+            self._layout()
+        elif self._page_width() != self._width:
+            self._relayout()
+        else:
+            self._center()
+            self._update_visible()
+
+    def _center(self):
+        """Shift the pages so they stay centred in the canvas"""
+        offset = max(0, (self.canvas.winfo_width() - self._width) // 2 - self.PAGE_GAP)
+        if offset != self._offset:
+            self.canvas.move("all", offset - self._offset, 0)
+            self._offset = offset
+
+    def _layout(self):
+        """Place a blank sheet for every page at the current width"""
+        if not self._page_sizes or self.canvas.winfo_width() <= 1:
+            # Not mapped yet; the first <Configure> lays it out
+            return
+        width = self._page_width()
+        self._width = width
+        self._offset = max(0, (self.canvas.winfo_width() - width) // 2 - self.PAGE_GAP)
+        self._photos.clear()
+        self.canvas.delete("all")
+
+        self._tops = []
+        left = self._offset + self.PAGE_GAP
+        top = self.PAGE_GAP
+        for page_width, page_height in self._page_sizes:
+            height = max(1, int(width * page_height / page_width))
+            self._tops.append(top)
+            self.canvas.create_rectangle(left, top, left + width, top + height, fill="white", outline="gray70")
+            top += height + self.PAGE_GAP
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), top))
+        self._update_visible()
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._update_id is None:
+            self._update_id = self.after_idle(self._update_visible)
+
+    def _on_mousewheel(self, event):
+        if event.delta:
+            self.canvas.yview_scroll(-3 if event.delta > 0 else 3, "units")
+
+    def _update_visible(self):
+        """Draw the pages in (or next to) the view and drop the images of far ones"""
+        self._update_id = None
+        if not self._tops:
+            return
+        view_top = self.canvas.canvasy(0)
+        view_bottom = view_top + self.canvas.winfo_height()
+        first = max(0, bisect.bisect_right(self._tops, view_top) - 1)
+        last = max(first, bisect.bisect_right(self._tops, view_bottom) - 1)
+
+        wanted = range(max(0, first - self.PREFETCH_PAGES),
+                       min(len(self._tops), last + self.PREFETCH_PAGES + 1))
+        self._wanted = frozenset(wanted)
+        for page_number in wanted:
+            self._draw_page(page_number)
+
+        for page_number in list(self._photos):
+            if page_number < first - self.KEEP_PAGES or page_number > last + self.KEEP_PAGES:
+                self.canvas.delete(f"image{page_number}")
+                del self._photos[page_number]
+
+    def _draw_page(self, page_number):
+        width = self._width
+        drawn = self._photos.get(page_number)
+        if drawn and drawn[0] == width and drawn[2]:
+            return
+
+        image, exact = cached_preview(self.key, page_number, width)
+        if image is not None and (exact or not drawn):
+            self._put_image(page_number, image, exact)
+        if exact or self._source is None or (page_number, width) in self._pending:
+            return
+
+        self._pending.add((page_number, width))
+        source, key, generation = self._source, self.key, self._generation
+
+        def work():
+            # Skip pages scrolled past or resized away before the worker got to them
+            if generation != self._generation or page_number not in self._wanted or width != self._width:
+                return None
+            return render_preview(key, source, page_number, width)
+
+        def done(image):
+            self._pending.discard((page_number, width))
+            if image is not None and generation == self._generation and width == self._width:
+                self._put_image(page_number, image, True)
+
+        run_in_background(self, work, done, lambda error: self._pending.discard((page_number, width)),
+                          pool=RENDER)
+
+    def _put_image(self, page_number, image, exact):
+        photo = ImageTk.PhotoImage(image)
+        self.canvas.delete(f"image{page_number}")
+        self.canvas.create_image(self._offset + self.PAGE_GAP, self._tops[page_number], image=photo, anchor="nw",
+                                 tags=(f"image{page_number}",))
+        self._photos[page_number] = (self._width, photo, exact)
@@ -52,7 +52,7 @@ def create_reminder(item_id, item_name, item_type, parent, callback=None):
             related_id=item_id,
             title=title_entry.get().strip(),
             description=desc_text.get("1.0", "end-1c").strip(),
-            due_date=due_date.get_date().strftime("%m/%d/%Y"),
+            due_date=Reminder.to_date_string(due_date.get_date()),
             status="pending"
         )
         reminder.save()
@@ -1,8 +1,62 @@
 import tkinter as tk
-from tkinter import ttk, font
+from tkinter import ttk, font, messagebox
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+import time
 
-def create_search_frame(parent, search_callback, reset_callback=None):
+from tracker.core.executor import DATABASE, submit_to
+
+SEARCH_DELAY_MS = 250
+PAGE_SIZE = 200
+MAX_CACHED_PAGES = 32
+POLL_INTERVAL_MS = 15
+LOADING_DELAY_MS = 150
+AUTOSIZE_SAMPLE = 1000
+AUTOSIZE_PADDING = 20
+MIN_COLUMN_WIDTH = 100
+# Tag of the rows shown while a page is still being fetched
+PLACEHOLDER_TAG = "placeholder"
+
+class Debouncer:
+    """
+    Coalesce a burst of calls into a single call once input pauses
+    
+    Each call restarts the timer, so a callback scheduled for an older
+    keystroke is cancelled before it ever runs. The callback runs on the
+    Tk event loop via after().
+    """
+    
+    def __init__(self, widget, callback, delay=SEARCH_DELAY_MS):
+        self.widget = widget
+        self.callback = callback
+        self.delay = delay
+        self._pending = None
+    
+    def __call__(self, *args):
+        self.cancel()
+        self._pending = self.widget.after(self.delay, self._fire)
+    
+    def cancel(self):
+        """Drop the pending call, if any"""
+        if self._pending is not None:
+            try:
+                self.widget.after_cancel(self._pending)
+            except tk.TclError:
+                pass
+            self._pending = None
+    
+    def flush(self):
+        """Run the callback now instead of waiting for the delay"""
+        self.cancel()
+        self.callback()
+    
+    def _fire(self):
+        self._pending = None
+        self.callback()
+
+def create_search_frame(parent, search_callback, reset_callback=None, live_search=False,
+                        delay=SEARCH_DELAY_MS):
     """
     Create a standard search frame with search entry and buttons
     
@@ -10,6 +64,8 @@ def create_search_frame(parent, search_callback, reset_callback=None):
     - parent: Parent widget
     - search_callback: Function to call when search is performed
     - reset_callback: Function to call when reset button is clicked
+    - live_search: Also search while typing, once typing pauses for `delay` ms
+    - delay: Debounce delay in milliseconds for live search
     
     Returns:
     - frame: The search frame
@@ -23,14 +79,23 @@ def create_search_frame(parent, search_callback, reset_callback=None):
     search_entry = tk.Entry(search_frame, textvariable=search_var, width=30)
     search_entry.pack(side="left", padx=5)
     
-    search_button = tk.Button(search_frame, text="Search", command=search_callback)
+    debounced = Debouncer(search_entry, search_callback, delay)
+    if live_search:
+        search_var.trace_add("write", debounced)
+    
+    search_button = tk.Button(search_frame, text="Search", command=debounced.flush)
     search_button.pack(side="left", padx=10)
     
     if reset_callback:
-        reset_button = tk.Button(search_frame, text="Reset", command=reset_callback)
+        def reset():
+            reset_callback()
+            # Clearing the entry queued a search that the reset already covers
+            debounced.cancel()
+        
+        reset_button = tk.Button(search_frame, text="Reset", command=reset)
         reset_button.pack(side="left")
     
-    search_entry.bind("<Return>", lambda event: search_callback())
+    search_entry.bind("<Return>", lambda event: debounced.flush())
     
     return search_frame, search_var
 
@@ -58,6 +123,380 @@ def create_filter_combobox(parent, label_text, values, callback=None):
     
     return filter_var
 
+def sync_treeview(tree, rows):
+    """
+    Update the top-level items of a treeview to match `rows` in place
+    
+    Parameters:
+    - tree: Treeview whose items use row keys as iids
+    - rows: Sequence of (iid, values) or (iid, values, tags) in display order
+    
+    Rows are matched by iid: new rows are inserted, missing ones deleted,
+    out-of-place ones moved, and only rows whose values or tags changed
+    are rewritten. Untouched rows keep their selection, focus and scroll
+    position.
+    """
+    # Last values and tags written per iid, so unchanged rows are skipped
+    rendered = getattr(tree, "_rendered_rows", None)
+    if rendered is None:
+        rendered = tree._rendered_rows = {}
+    
+    keys = [str(row[0]) for row in rows]
+    wanted = set(keys)
+    order = []
+    stale = []
+    for iid in tree.get_children():
+        (order if iid in wanted else stale).append(iid)
+    if stale:
+        tree.delete(*stale)
+        for iid in stale:
+            rendered.pop(iid, None)
+    present = set(order)
+    
+    for index, (iid, row) in enumerate(zip(keys, rows)):
+        state = (tuple(row[1]), tuple(row[2]) if len(row) > 2 else ())
+        if index < len(order) and order[index] == iid:
+            if rendered.get(iid) != state:
+                tree.item(iid, values=state[0], tags=state[1])
+        elif iid in present:
+            tree.move(iid, "", index)
+            order.remove(iid)
+            order.insert(index, iid)
+            if rendered.get(iid) != state:
+                tree.item(iid, values=state[0], tags=state[1])
+        else:
+            tree.insert("", index, iid=iid, values=state[0], tags=state[1])
+            order.insert(index, iid)
+        rendered[iid] = state
+
+class ListRowProvider:
+    """
+    Row provider over an in-memory sequence
+    
+    `to_row(item)` turns an item into `(iid, values)` or `(iid, values, tags)`
+    and is only called for rows that are actually displayed.
+    """
+    
+    def __init__(self, items, to_row):
+        self.items = items
+        self.to_row = to_row
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def rows(self, start, stop):
+        return [self.to_row(item) for item in self.items[start:stop]]
+    
+    def sample(self, limit):
+        """Return up to `limit` rows spread evenly over the items"""
+        step = max(1, len(self.items) // limit)
+        return [self.to_row(item) for item in self.items[::step][:limit]]
+
+class QueryRowProvider:
+    """
+    Row provider that reads a sorted model query one page at a time
+    
+    Pages are fetched as they scroll into view. A page that follows one
+    already loaded continues from its last row with a keyset seek, so
+    scrolling down a 100k-row table never materializes the rows above.
+    Jumping far ahead falls back to an OFFSET.
+    
+    Build it with prefetch() on the database worker. Once attached to a
+    tree, pages that are still missing are fetched on the worker too and
+    shown as placeholder rows until they arrive, so scrolling never runs a
+    query on the Tk thread.
+    """
+    
+    def __init__(self, model, to_row, where_clause="", params=(), columns=None,
+                 order_by=None, descending=False, page_size=PAGE_SIZE):
+        if columns and order_by and order_by not in columns:
+            columns = tuple(columns) + (order_by,)
+        self.model = model
+        self.to_row = to_row
+        self.query = dict(where_clause=where_clause, params=tuple(params), columns=columns,
+                          order_by=order_by, descending=descending)
+        self.page_size = page_size
+        self._count = None
+        self._pages = OrderedDict()
+        self._tree = None
+        self._loading = set()
+    
+    def prefetch(self, start=0, stop=PAGE_SIZE):
+        """Load the count and the pages covering start..stop without building rows"""
+        if self._count is None:
+            self._count = self._load_count()
+        stop = min(stop, self._count)
+        if start < stop:
+            for page in range(start // self.page_size, (stop - 1) // self.page_size + 1):
+                if page not in self._pages:
+                    self._store(page, self._load_page(page, self._pages.get(page - 1)))
+        return self
+    
+    def attach(self, tree):
+        """Fetch missing pages in the background from now on and redraw `tree` when they arrive"""
+        self._tree = tree
+        if self._count is None:
+            run_in_background(tree, self._load_count, self._count_loaded)
+    
+    def __len__(self):
+        return self._count or 0
+    
+    def rows(self, start, stop):
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        
+        rows = []
+        for page in range(start // self.page_size, (stop - 1) // self.page_size + 1):
+            offset = page * self.page_size
+            first, last = max(start, offset), min(stop, offset + self.page_size)
+            items = self._page(page)
+            if items is None:
+                rows.extend((f"loading-{index}", ("Loading...",), (PLACEHOLDER_TAG,))
+                            for index in range(first, last))
+            else:
+                rows.extend(self.to_row(item) for item in items[first - offset:last - offset])
+        return rows
+    
+    def sample(self, limit):
+        """Return up to `limit` rows from the pages already loaded, without querying"""
+        items = [item for page in self._pages.values() for item in page]
+        step = max(1, len(items) // limit)
+        return [self.to_row(item) for item in items[::step][:limit]]
+    
+    def _load_count(self):
+        return self.model.count(self.query["where_clause"], self.query["params"])
+    
+    def _load_page(self, page, previous):
+        if previous:
+            return self.model.find_all(limit=self.page_size, after=previous[-1], **self.query)
+        return self.model.find_all(limit=self.page_size, offset=page * self.page_size, **self.query)
+    
+    def _store(self, page, items):
+        self._pages[page] = items
+        while len(self._pages) > MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+    
+    def _page(self, page):
+        """Return the items of `page`, or None while it is being fetched"""
+        items = self._pages.get(page)
+        if items is not None:
+            self._pages.move_to_end(page)
+            return items
+        if self._tree is None:
+            # Not shown anywhere yet, so this is the worker building it
+            items = self._load_page(page, self._pages.get(page - 1))
+            self._store(page, items)
+            return items
+        
+        if page not in self._loading:
+            self._loading.add(page)
+            previous = self._pages.get(page - 1)
+            
+            def loaded(items):
+                self._loading.discard(page)
+                self._store(page, items)
+                self._redraw()
+            
+            def failed(error):
+                self._loading.discard(page)
+                show_background_error(error)
+            
+            run_in_background(self._tree, lambda: self._load_page(page, previous), loaded, failed)
+        return None
+    
+    def _count_loaded(self, count):
+        self._count = count
+        self._redraw()
+    
+    def _redraw(self):
+        # Results for a provider the tree has since replaced are dropped
+        if getattr(self._tree, "_provider", None) is self:
+            self._tree.refresh()
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    Treeview that only holds the rows currently on screen
+    
+    Rows come from a provider with `__len__` and `rows(start, stop)` (see
+    ListRowProvider). The vertical scrollbar is driven from the provider's
+    length, and scrolling swaps the visible window in place, so refreshing
+    and scrolling cost O(visible rows) however many rows there are. Row
+    iids are the provider's keys, so identify_row, item and selection work
+    as with a plain Treeview; selection of rows scrolled out of view is
+    remembered and restored. Each set_provider() generates a
+    <<ProviderChanged>> event once the new rows are shown.
+    """
+    
+    def __init__(self, master=None, **kw):
+        self._yscrollcommand = kw.pop("yscrollcommand", None)
+        super().__init__(master, **kw)
+        self._provider = ListRowProvider((), None)
+        self._first = 0
+        self._visible = 0
+        self._selection = set()
+        
+        self.bind("<Configure>", lambda e: self._render(), add="+")
+        self.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind("<Button-4>", lambda e: self._scroll_by(-3), add="+")
+        self.bind("<Button-5>", lambda e: self._scroll_by(3), add="+")
+        self.bind("<Up>", lambda e: self._on_arrow(-1), add="+")
+        self.bind("<Down>", lambda e: self._on_arrow(1), add="+")
+    
+    def configure(self, cnf=None, **kw):
+        # The scrollbar follows the provider, not the rows Tk holds
+        if isinstance(cnf, dict) and "yscrollcommand" in cnf:
+            cnf = dict(cnf)
+            kw["yscrollcommand"] = cnf.pop("yscrollcommand")
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+            self._update_scrollbar()
+            if not cnf and not kw:
+                return None
+        return super().configure(cnf, **kw)
+    
+    config = configure
+    
+    def sample_rows(self, limit=AUTOSIZE_SAMPLE):
+        """Return up to `limit` of the provider's rows, including ones not on screen"""
+        return self._provider.sample(limit)
+    
+    def set_provider(self, provider):
+        """Show the rows of `provider`, keeping the scroll position where possible"""
+        self._sync_selection()
+        # Remembered off-screen selections may not exist in the new rows
+        self._selection &= set(super().selection())
+        self._provider = provider
+        if hasattr(provider, "attach"):
+            provider.attach(self)
+        self._render()
+        self.event_generate("<<ProviderChanged>>")
+    
+    def refresh(self):
+        """Redraw the visible rows, e.g. after the provider loaded more of them"""
+        self._render()
+    
+    def yview(self, *args):
+        if not args:
+            total = len(self._provider)
+            if not total:
+                return (0.0, 1.0)
+            return (self._first / total, min(1.0, (self._first + self._visible) / total))
+        
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._provider)))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self._visible - 1)
+            self._scroll_by(amount)
+    
+    def selection(self, *args):
+        if args:
+            return super().selection(*args)
+        self._sync_selection()
+        visible = tuple(iid for iid in super().selection() if not self._is_placeholder(iid))
+        return visible + tuple(iid for iid in self._selection if iid not in visible)
+    
+    def identify_row(self, y):
+        # Placeholder rows act like empty space until their page arrives
+        iid = super().identify_row(y)
+        return "" if iid and self._is_placeholder(iid) else iid
+    
+    def _is_placeholder(self, iid):
+        return PLACEHOLDER_TAG in self.item(iid, "tags")
+    
+    def selection_set(self, *items):
+        items = self._flatten(items)
+        self._selection = set(items)
+        super().selection_set([iid for iid in items if self.exists(iid)])
+    
+    def selection_remove(self, *items):
+        items = self._flatten(items)
+        self._selection.difference_update(items)
+        super().selection_remove([iid for iid in items if self.exists(iid)])
+    
+    @staticmethod
+    def _flatten(items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        return [str(iid) for iid in items]
+    
+    def _sync_selection(self):
+        visible = set(self.get_children())
+        selected = {iid for iid in super().selection() if not self._is_placeholder(iid)}
+        self._selection = (self._selection - visible) | selected
+    
+    def _visible_rows(self):
+        style = ttk.Style(self)
+        row_height = style.lookup(self.cget("style") or "Treeview", "rowheight")
+        try:
+            row_height = int(row_height)
+        except (TypeError, ValueError):
+            row_height = font.nametofont("TkDefaultFont").metrics("linespace") + 4
+        
+        height = self.winfo_height()
+        if height <= 1:
+            # Not laid out yet
+            return int(self.cget("height"))
+        # Only whole rows, so Tk never scrolls the window itself; the
+        # heading takes roughly one row
+        heading = 1 if "headings" in str(self.cget("show")) else 0
+        return max(1, height // row_height - heading)
+    
+    def _scroll_by(self, amount):
+        self._scroll_to(self._first + amount)
+        return "break"
+    
+    def _scroll_to(self, first):
+        first = max(0, min(first, len(self._provider) - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+    
+    def _on_mousewheel(self, event):
+        if event.delta:
+            return self._scroll_by(-3 if event.delta > 0 else 3)
+    
+    def _on_arrow(self, step):
+        children = self.get_children()
+        focus = self.focus()
+        if not children or focus not in (children[0], children[-1]):
+            return None
+        index = children.index(focus) + self._first + step
+        if not 0 <= index < len(self._provider):
+            return "break"
+        
+        if not self._first <= index < self._first + self._visible - 1:
+            self._scroll_by(step)
+        iid = str(self._provider.rows(index, index + 1)[0][0])
+        if self._is_placeholder(iid):
+            return "break"
+        self.selection_set(iid)
+        self.focus(iid)
+        return "break"
+    
+    def _render(self):
+        """Show the current window of the provider, reusing rows still in view"""
+        self._sync_selection()
+        self._visible = self._visible_rows()
+        total = len(self._provider)
+        self._first = max(0, min(self._first, total - self._visible))
+        
+        rows = self._provider.rows(self._first, self._first + self._visible)
+        sync_treeview(self, rows)
+        
+        # Only touch the selection when it changed, to avoid spurious <<TreeviewSelect>>
+        selected = [iid for iid in self.get_children() if iid in self._selection]
+        if set(selected) != set(super().selection()):
+            super().selection_set(selected)
+        self._update_scrollbar()
+    
+    def _update_scrollbar(self):
+        if self._yscrollcommand:
+            first, last = self.yview()
+            self._yscrollcommand(first, last)
+
 def create_sortable_treeview(parent, columns, sort_callback):
     """
     Create a treeview with sortable columns
@@ -69,12 +508,13 @@ def create_sortable_treeview(parent, columns, sort_callback):
                     should accept column name as parameter
     
     Returns:
-    - tree: The treeview widget
+    - tree: A VirtualTreeview; fill it with tree.set_provider(...)
+    - table_frame: The frame holding the tree and its scrollbar
     """
     table_frame = tk.Frame(parent)
     table_frame.pack(fill="both", expand=True)
     
-    tree = ttk.Treeview(table_frame, columns=columns, show="headings")
+    tree = VirtualTreeview(table_frame, columns=columns, show="headings")
     
     for col in columns:
         tree.heading(col, text=col, command=lambda c=col: sort_callback(c))
@@ -119,27 +559,234 @@ def add_scrollbars_to_text(parent, height=5, width=40):
     
     return frame, text_widget
 
-def resize_treeview_columns(tree, event):
-    """Auto-resize treeview columns based on content"""
-    region = tree.identify_region(event.x, event.y)
-    if region == "separator":
-        column = tree.identify_column(event.x)
-        column_index = int(column.replace('#', '')) - 1
+def create_progress_callback(progress_bar):
+    """
+    Build a progress(done, total) callback that drives a ttk.Progressbar
+    
+    The callback only records the numbers, so it can be called from the
+    database worker; the bar is redrawn from the Tk thread until the work
+    reaches its total, finish() is called or the bar is destroyed.
+    
+    Returns:
+    - update_progress: The progress(done, total) callback
+    - finish: Stops redrawing; call it when the work fails or is abandoned
+    """
+    state = {"done": 0, "total": 0, "finished": False}
+    
+    def update_progress(done, total):
+        state["done"], state["total"] = done, total
+        if total and done >= total:
+            state["finished"] = True
+    
+    def finish():
+        state["finished"] = True
+    
+    def redraw():
+        if not progress_bar.winfo_exists():
+            return
+        progress_bar.configure(maximum=max(state["total"], 1), value=state["done"])
+        if not state["finished"]:
+            progress_bar.after(POLL_INTERVAL_MS, redraw)
+    
+    redraw()
+    return update_progress, finish
+
+def show_background_error(error):
+    """Default error handler for background work"""
+    messagebox.showerror("Error", str(error))
+
+def run_in_background(widget, work, on_done=None, on_error=None, indicator=None, pool=DATABASE):
+    """
+    Run `work()` on a worker thread and hand its result back to Tk
+    
+    Parameters:
+    - widget: Widget whose event loop receives the result
+    - work: Callable run on the worker; must not touch any widget
+    - on_done: Called on the Tk thread with the return value of `work`
+    - on_error: Called on the Tk thread with the exception if `work` raised
+    - indicator: Optional LoadingIndicator shown while the work is pending
+    - pool: Worker pool to run on (see tracker.core.executor)
+    
+    Returns:
+    - future: The concurrent.futures.Future of the job
+    """
+    future = submit_to(pool, work)
+    if indicator:
+        indicator.start()
+    
+    def poll():
+        if not future.done():
+            widget.after(POLL_INTERVAL_MS, poll)
+            return
+        if indicator:
+            indicator.stop()
+        if future.cancelled() or not widget.winfo_exists():
+            return
         
-        columns = tree.cget("columns")
-        if 0 <= column_index < len(columns):
-            col_name = columns[column_index]
-            
-            current_width = tree.column(col_name, "width")
-            
-            header_width = font.Font().measure(col_name) + 20
-            max_width = header_width
-            
-            for item in tree.get_children():
-                values = tree.item(item, 'values')
-                if column_index < len(values):
-                    cell_value = str(values[column_index])
-                    cell_width = font.Font().measure(cell_value) + 20
-                    max_width = max(max_width, cell_width)
-            
-            tree.column(col_name, width=max(100, max_width))
\ No newline at end of file
+        error = future.exception()
+        if error is not None:
+            (on_error or show_background_error)(error)
+        elif on_done:
+            on_done(future.result())
+    
+    widget.after(POLL_INTERVAL_MS, poll)
+    return future
+
+class BackgroundTask:
+    """
+    A repeatable background job of which only the newest run matters
+    
+    Starting a run cancels the previous one if it is still queued and
+    discards its result if it already started, so a slow stale query can
+    never overwrite a newer one.
+    """
+    
+    def __init__(self, widget, indicator=None, pool=DATABASE):
+        self.widget = widget
+        self.indicator = indicator
+        self.pool = pool
+        self._future = None
+        self._generation = 0
+    
+    def cancel(self):
+        """Drop the pending run, if any, without starting a new one"""
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self._generation += 1
+    
+    def run(self, work, on_done=None, on_error=None):
+        self.cancel()
+        generation = self._generation
+        
+        def deliver(result):
+            if generation == self._generation and on_done:
+                on_done(result)
+        
+        def fail(error):
+            if generation == self._generation:
+                (on_error or show_background_error)(error)
+        
+        self._future = run_in_background(self.widget, work, deliver, fail, self.indicator, self.pool)
+        return self._future
+
+class LoadingIndicator:
+    """
+    A "Loading..." label packed while background work is pending
+    
+    It only appears if the work takes longer than `delay` ms, so fast
+    queries don't make it flicker.
+    """
+    
+    def __init__(self, parent, text="Loading...", delay=LOADING_DELAY_MS, **pack_options):
+        self.label = ttk.Label(parent, text=text, foreground="gray")
+        self.delay = delay
+        self.pack_options = pack_options or {"side": "left", "padx": 10}
+        self._pending = 0
+        self._show_id = None
+    
+    def start(self):
+        self._pending += 1
+        if self._pending == 1:
+            self._show_id = self.label.after(self.delay, self._show)
+    
+    def stop(self):
+        self._pending = max(0, self._pending - 1)
+        if self._pending:
+            return
+        if self._show_id is not None:
+            self.label.after_cancel(self._show_id)
+            self._show_id = None
+        if self.label.winfo_exists():
+            self.label.pack_forget()
+    
+    def _show(self):
+        self._show_id = None
+        self.label.pack(**self.pack_options)
+
+class LazyTabs:
+    """
+    Notebook tabs whose contents are built the first time they are shown
+    
+    `build(frame)` runs on the first <<NotebookTabChanged>> that selects the
+    tab, or when ensure_built() asks for it, so startup only pays for the
+    tab that is actually on screen. `on_build(text, seconds)` is called
+    after each build, for timing.
+    """
+    
+    def __init__(self, notebook, on_build=None):
+        self.notebook = notebook
+        self.on_build = on_build
+        self._builders = {}
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.ensure_built(notebook.select()), add="+")
+    
+    def add(self, text, build):
+        """Add an empty tab that `build` fills in later and return its frame"""
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._builders[str(frame)] = (frame, text, build)
+        return frame
+    
+    def ensure_built(self, frame):
+        """Build the tab `frame` (a widget or its path name) now if it hasn't been yet"""
+        entry = self._builders.pop(str(frame), None)
+        if entry is None:
+            return
+        frame, text, build = entry
+        start = time.perf_counter()
+        build(frame)
+        if self.on_build:
+            self.on_build(text, time.perf_counter() - start)
+
+_fonts = {}
+
+def _style_font(tree, style_name, default):
+    """Return the font description `style_name` uses, creating its Font object once"""
+    description = ttk.Style(tree).lookup(style_name, "font") or default
+    if description not in _fonts:
+        _fonts[description] = font.Font(root=tree, font=description)
+    return description
+
+@lru_cache(maxsize=8192)
+def _text_width(font_description, text):
+    """Width of `text` in pixels, memoized since the same values repeat across rows"""
+    return _fonts[font_description].measure(text)
+
+def resize_treeview_columns(tree, event):
+    """
+    Fit a column to its content when its heading separator is double-clicked
+    
+    Values are sampled from the tree's row provider rather than read back
+    from the widget, so the fit covers rows scrolled out of view and costs
+    one measurement per distinct string.
+    
+    Parameters:
+    - tree: The treeview (a VirtualTreeview, or a plain Treeview)
+    - event: The <Double-1> event
+    
+    Returns:
+    - "break" if a column was resized, so other double-click handlers skip it
+    """
+    if tree.identify_region(event.x, event.y) != "separator":
+        return None
+    
+    column_index = int(tree.identify_column(event.x).replace('#', '')) - 1
+    columns = tree.cget("columns")
+    if not 0 <= column_index < len(columns):
+        return None
+    col_name = columns[column_index]
+    
+    if hasattr(tree, "sample_rows"):
+        rows = tree.sample_rows()
+    else:
+        rows = [(item, tree.item(item, 'values')) for item in tree.get_children()]
+    values = {str(row[1][column_index]) for row in rows if column_index < len(row[1])}
+    
+    heading_font = _style_font(tree, "Treeview.Heading", "TkHeadingFont")
+    cell_font = _style_font(tree, "Treeview", "TkDefaultFont")
+    max_width = _text_width(heading_font, tree.heading(col_name, "text") or col_name)
+    for value in values:
+        max_width = max(max_width, _text_width(cell_font, value))
+    
+    tree.column(col_name, width=max(MIN_COLUMN_WIDTH, max_width + AUTOSIZE_PADDING))
+    return "break"
\ No newline at end of file